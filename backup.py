@@ -1,16 +1,21 @@
 import os
 import shutil
+import stat
 import datetime
-import glob
 import argparse
 import sys
 import time
 import json
+import queue
 import subprocess
 import threading
 import tempfile
 import hashlib
 import errno
+import re
+import zipfile
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import ctypes
@@ -29,16 +34,31 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# Skip ANSI codes when output is piped or redirected (or NO_COLOR is set)
+_STDOUT_IS_TTY = sys.stdout.isatty()
+_USE_COLOR = _STDOUT_IS_TTY and "NO_COLOR" not in os.environ
+
+def colorize(text: str, color: str = Colors.WHITE, bold: bool = False) -> str:
+    """Wrap text in ANSI color codes when writing to a terminal"""
+    if not _USE_COLOR:
+        return text
+    prefix = Colors.BOLD if bold else ""
+    return f"{prefix}{color}{text}{Colors.END}"
+
 def print_colored(text: str, color: str = Colors.WHITE, bold: bool = False, end: str = "\n"):
     """Print colored text to terminal"""
-    prefix = Colors.BOLD if bold else ""
-    print(f"{prefix}{color}{text}{Colors.END}", end=end)
+    print(colorize(text, color, bold), end=end)
+
+def format_header(text: str) -> str:
+    """Return a formatted header, ready to write to the terminal"""
+    rule = '=' * 50
+    return (colorize(f"\n{rule}", Colors.CYAN) + "\n"
+            + colorize(f" {text} ", Colors.CYAN, bold=True) + "\n"
+            + colorize(rule, Colors.CYAN) + "\n")
 
 def print_header(text: str):
     """Print a formatted header"""
-    print_colored(f"\n{'='*50}", Colors.CYAN)
-    print_colored(f" {text} ", Colors.CYAN, bold=True)
-    print_colored(f"{'='*50}", Colors.CYAN)
+    sys.stdout.write(format_header(text))
 
 def print_success(text: str):
     """Print success message"""
@@ -56,38 +76,398 @@ def print_info(text: str):
     """Print info message"""
     print_colored(f"ℹ {text}", Colors.BLUE)
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_PROBLEM_RE = re.compile(r"[✗⚠] .*")
+
+
+class _BackgroundOutput:
+    """Stand-in for sys.stdout while the interactive menu runs backups in the background.
+    While a background backup is running, output from any thread other than the menu's own
+    (the backup thread, its copy workers) is held back instead of being written over the
+    prompt the user is typing at; take_problems() hands over the warnings and errors in it.
+    """
+
+    def __init__(self, stream, owner: threading.Thread):
+        self._stream = stream
+        self._owner = owner
+        self._lock = threading.Lock()
+        self._active = 0
+        self._held: List[str] = []
+
+    def write(self, text: str) -> int:
+        if self._active and threading.current_thread() is not self._owner:
+            with self._lock:
+                self._held.append(text)
+            return len(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def hold(self):
+        """Start holding other threads' output (one call per running background task)"""
+        with self._lock:
+            self._active += 1
+
+    def release(self):
+        with self._lock:
+            self._active -= 1
+
+    def take_problems(self) -> List[str]:
+        """Return the warning/error lines held back so far (progress and info are dropped)"""
+        with self._lock:
+            text = "".join(self._held)
+            self._held.clear()
+        # A warning can land right after a half-drawn progress bar on the same line
+        return _PROBLEM_RE.findall(_ANSI_RE.sub("", text).replace("\r", "\n"))
+
+
+# The main menu never changes, so it is formatted once and written in one go
+MAIN_MENU_HEADER = format_header("Main Menu")
+MAIN_MENU_OPTIONS = "".join(colorize(text, color) + "\n" for text, color in (
+    ("1. 💾 Create backup", Colors.GREEN),
+    ("2. 📋 List backups", Colors.BLUE),
+    ("3. 🔄 Restore backup", Colors.YELLOW),
+    ("4. 🗑️ Delete backup", Colors.RED),
+    ("5. 🧹 Cleanup old backups", Colors.MAGENTA),
+    ("6. 🎮 Switch game", Colors.CYAN),
+    ("7. ⚙️ Manage games config", Colors.WHITE),
+    ("8. 🚪 Exit", Colors.WHITE),
+))
+
+CONFIG_MENU = format_header("Game Configuration Manager") + "".join(
+    colorize(text, color) + "\n" for text, color in (
+        ("1. 📋 List games", Colors.BLUE),
+        ("2. ➕ Add game", Colors.GREEN),
+        ("3. ✏️  Edit game", Colors.YELLOW),
+        ("4. 🗑️  Remove game", Colors.RED),
+        ("5. 📝 Open config in Notepad", Colors.MAGENTA),
+        ("6. 🚪 Back to main menu", Colors.WHITE),
+    ))
+
+MAIN_MENU_PROMPT = f"\n{Colors.CYAN}Enter your choice (1-8): {Colors.END}"
+CONFIG_MENU_PROMPT = f"\n{Colors.CYAN}Enter your choice (1-6): {Colors.END}"
+CONTINUE_PROMPT = f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}"
+
+def emit_menu(parts) -> None:
+    """Write pre-formatted menu text with a single write and flush"""
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+
+def format_current_game(game_name: Optional[str]) -> str:
+    """Return the "Current Game" line shown above the main menu"""
+    if not game_name:
+        return ""
+    return (colorize("🎮 Current Game: ", Colors.CYAN, bold=True)
+            + colorize(f"{game_name}\n", Colors.WHITE, bold=True) + "\n")
+
+def format_configured_games(games: List[tuple]) -> str:
+    """Return the "Configured Games" listing used by the config manager"""
+    parts = [format_header("Configured Games")]
+    for i, (game_id, game_info) in enumerate(games, 1):
+        name = game_info.get("name", game_id)
+        backup_path = game_info.get("backup_path", "")
+        description = game_info.get("description", "")
+        parts.append(colorize(f"{i:2d}. {name} (ID: {game_id})", Colors.WHITE, bold=True) + "\n")
+        parts.append(colorize(f"    📁 Save: {game_info.get('save_path', 'Unknown')}", Colors.BLUE) + "\n")
+        if backup_path:
+            parts.append(colorize(f"    💾 Backup: {backup_path}", Colors.GREEN) + "\n")
+        if description:
+            parts.append(colorize(f"    📝 {description}", Colors.MAGENTA) + "\n")
+    return "".join(parts)
+
 def show_progress(current: int, total: int, prefix: str = "Progress"):
     """Show a simple progress indicator"""
     percent = (current / total) * 100
     bar_length = 30
     filled_length = int(bar_length * current // total)
     bar = '█' * filled_length + '-' * (bar_length - filled_length)
-    print(f"\r{prefix}: |{bar}| {percent:.1f}% ({current}/{total})", end='', flush=True)
+    sys.stdout.write(f"\r{prefix}: |{bar}| {percent:.1f}% ({current}/{total})")
+    sys.stdout.flush()
+
+
+class _ProgressCounter:
+    """Thread-safe progress counter that only redraws when the whole percentage changes,
+    at most every 50 ms. When stdout isn't a terminal only the final state is written.
+    """
+    __slots__ = ('n', 'total', 'prefix', 'lock', 'last_pct', 'last_emit')
+
+    MIN_INTERVAL = 0.05
+
+    def __init__(self, total: int, prefix: str = "Progress"):
+        self.n = 0
+        self.total = total
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.last_pct = -1
+        self.last_emit = 0.0
+
+    def tick(self):
+        with self.lock:
+            self.n += 1
+            if self.n >= self.total:
+                show_progress(self.n, self.total, self.prefix)
+                return
+            if not _STDOUT_IS_TTY:
+                return
+            pct = self.n * 100 // self.total
+            if pct > self.last_pct:
+                now = time.monotonic()
+                if now - self.last_emit >= self.MIN_INTERVAL:
+                    self.last_pct = pct
+                    self.last_emit = now
+                    show_progress(self.n, self.total, self.prefix)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0B"
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
-    return f"{size:.1f}{size_names[i]}"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f}{_SIZE_UNITS[i]}"
 
 def get_directory_size(path: Path) -> int:
     """Calculate total size of directory"""
+    return get_directory_stats(path)[1]
+
+
+# POSIX: walk with directory fds and stat names relative to them instead of full paths
+_USE_FWALK = hasattr(os, 'fwalk') and os.stat in os.supports_dir_fd
+
+
+def get_directory_stats(path: Path) -> tuple:
+    """Return (file_count, total_size) of a directory in a single pass"""
+    file_count = 0
     total_size = 0
+    if _USE_FWALK:
+        for _, _, filenames, dir_fd in os.fwalk(path):
+            for name in filenames:
+                try:
+                    st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    file_count += 1
+                    total_size += st.st_size
+        return file_count, total_size
+
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # DirEntry caches the type (and on Windows the size) from the directory read
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        file_count += 1
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return file_count, total_size
+
+
+# File suffixes of single-file (compressed) backups
+ARCHIVE_SUFFIXES = (".zip",)
+
+# Read/write chunk for archive members; zipfile's own write() copies 8 KiB at a time
+_ARCHIVE_CHUNK = 1 << 20
+# Already-compressed formats gain nothing from DEFLATE, so they are stored as-is
+_STORED_SUFFIXES = (".zip", ".gz", ".7z", ".rar", ".zst", ".xz", ".png", ".jpg", ".jpeg", ".webp", ".ogg", ".mp3", ".mp4")
+
+# Bookkeeping files written at the top level of a backup; never restored into the save dir
+BACKUP_SIDECAR_FILES = frozenset({".backup_description", ".backup_meta.json", ".backup_manifest.json"})
+
+
+# The app's own files; never deleted by an in-place restore of the folder the script lives in
+_APP_FILE_NAMES = frozenset({"backup.py", "backup_gui.py", "backup_gui.tcss", "backup.bat", "backup_gui.bat",
+                             "games_config.json", "games_config.json.default"})
+
+# A backup dir scan is only reused when the dir's mtime is at least this old (see _scan_backups)
+_SCAN_CACHE_MIN_AGE_NS = 5_000_000_000
+
+# backup_YYYYMMDD_HHMMSS[.zip]
+_BACKUP_TS_RE = re.compile(r"backup_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})")
+
+
+@lru_cache(maxsize=1024)
+def parse_backup_timestamp(backup_name: str) -> Optional[datetime.datetime]:
+    """Return the creation time encoded in a backup's name, or None if it doesn't have one.
+    Backup names never change, so results are cached across listings.
+    """
+    m = _BACKUP_TS_RE.match(backup_name)
+    if not m:
+        return None
+    try:
+        return datetime.datetime(*map(int, m.groups()))
+    except ValueError:
+        return None
+
+
+# (seconds per unit, long label, short label), largest unit first
+_AGE_UNITS = ((86400, " days", "d"), (3600, " hours", "h"), (60, " minutes", "m"))
+
+def format_age(age: datetime.timedelta, short: bool = False) -> str:
+    """Format a backup's age as "3 hours ago", or "3h ago" when short"""
+    seconds = int(age.total_seconds())
+    for unit, long_label, short_label in _AGE_UNITS:
+        if seconds >= unit:
+            return f"{seconds // unit}{short_label if short else long_label} ago"
+    return "0m ago" if short else "Just now"
+
+
+def is_archive_backup(path) -> bool:
+    """Return True if the backup at path is a single compressed archive rather than a folder"""
+    return os.fspath(path).endswith(ARCHIVE_SUFFIXES)
+
+
+def get_backup_size(path) -> int:
+    """Size on disk of a backup folder or archive"""
+    if is_archive_backup(path):
+        return os.path.getsize(path)
+    return get_directory_size(path)
+
+
+def read_backup_description(path) -> str:
+    """Read a backup's description, or return an empty string if it has none"""
     try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
-    except (OSError, FileNotFoundError):
-        pass
-    return total_size
+        if is_archive_backup(path):
+            with zipfile.ZipFile(path) as zf:
+                return zf.read(".backup_description").decode('utf-8').strip()
+        with open(os.path.join(path, ".backup_description"), encoding='utf-8') as f:
+            return f.read().strip()
+    except (OSError, KeyError, zipfile.BadZipFile, UnicodeDecodeError):
+        return ""
+
+
+def read_backup_meta(path) -> Dict[str, Any]:
+    """Read a backup's .backup_meta.json, or return an empty dict if it has none"""
+    try:
+        if is_archive_backup(path):
+            with zipfile.ZipFile(path) as zf:
+                return json.loads(zf.read(".backup_meta.json"))
+        with open(os.path.join(path, ".backup_meta.json"), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, KeyError, zipfile.BadZipFile, ValueError):
+        return {}
+
+
+def read_backup_info(path) -> tuple:
+    """Return (size_bytes, description) for display. Folder backups answer from their
+    metadata file with one read; backups without one are measured on the fly.
+    """
+    if is_archive_backup(path):
+        return os.path.getsize(path), read_backup_description(path)
+    meta = read_backup_meta(path)
+    if not isinstance(meta.get("size_bytes"), int):
+        return get_directory_size(path), read_backup_description(path)
+    if "description" in meta:
+        return meta["size_bytes"], str(meta["description"]).strip()
+    # Only recovered backups can have a description file that the metadata doesn't mention
+    description = read_backup_description(path) if meta.get("recovered") else ""
+    return meta["size_bytes"], description
+
+
+# os.link errors meaning the backup filesystem doesn't support hardlinks at all
+_NO_HARDLINK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ("EPERM", "EXDEV", "ENOTSUP", "EOPNOTSUPP", "ENOSYS") if hasattr(errno, name)
+)
+
+
+# Files below this size are copied with a single read and write
+_SMALL_FILE_SIZE = 64 * 1024
+
+
+def _fast_copyfile(src: str, dst: str) -> None:
+    """Copy file data, modification time and permission bits like shutil.copy2.
+    Small files (the bulk of most save folders) take one read and one write. Larger
+    files on Linux use os.copy_file_range, which keeps the data in-kernel and can reflink
+    on copy-on-write filesystems (btrfs/XFS); elsewhere shutil.copyfile is used.
+    """
+    with open(src, 'rb') as fsrc:
+        st = os.fstat(fsrc.fileno())
+        if st.st_size < _SMALL_FILE_SIZE:
+            data = fsrc.read()
+            with open(dst, 'wb') as fdst:
+                fdst.write(data)
+        elif hasattr(os, "copy_file_range"):
+            try:
+                with open(dst, 'wb') as fdst:
+                    infd, outfd = fsrc.fileno(), fdst.fileno()
+                    while os.copy_file_range(infd, outfd, 1 << 30) > 0:
+                        pass
+            except OSError as e:
+                # Unsupported filesystem pair or kernel: fall back to the regular copy
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                    raise
+                shutil.copyfile(src, dst)
+        else:
+            shutil.copyfile(src, dst)
+    # Unlike shutil.copystat this skips listing and copying extended attributes per file
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+
+# Names inside a save dir that are never backed up
+SAVE_IGNORE_NAMES = frozenset({"backups", "__pycache__"})
+SAVE_IGNORE_SUFFIXES = (".pyc", ".tmp")
+
+
+def _ignore_save_junk(directory, names) -> set:
+    """copytree-style ignore callable for SAVE_IGNORE_NAMES and SAVE_IGNORE_SUFFIXES"""
+    if os.name == 'nt':
+        # Windows names are case-insensitive
+        return {n for n in names if n.lower() in SAVE_IGNORE_NAMES or n.lower().endswith(SAVE_IGNORE_SUFFIXES)}
+    return {n for n in names if n in SAVE_IGNORE_NAMES or n.endswith(SAVE_IGNORE_SUFFIXES)}
+
+
+def _scan_tree(src: Path, ignore=None):
+    """Yield (rel_path, is_dir) for everything under src, parents before children, using
+    os.scandir so file types come from the directory read rather than a stat per entry.
+    `ignore` follows the shutil.copytree convention: ignore(dir, names) -> names to skip.
+    Like copytree, symlinked directories are followed (a link back to one of its own parents
+    is skipped with a warning) and an unreadable directory raises OSError.
+    """
+    def dir_key(path):
+        st = os.stat(path)
+        return st.st_dev, st.st_ino
+
+    root = os.fspath(src)
+    stack = [(root, "", frozenset([dir_key(root)]))]
+    while stack:
+        directory, rel_root, ancestors = stack.pop()
+        with os.scandir(directory) as it:
+            entries = list(it)
+        ignored = ignore(directory, [e.name for e in entries]) if ignore else ()
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            rel = os.path.join(rel_root, entry.name) if rel_root else entry.name
+            if entry.is_dir():
+                key = dir_key(entry.path)
+                if key in ancestors:
+                    print_warning(f"Skipping {rel}: it links back to a folder that contains it")
+                    continue
+                yield rel, True
+                stack.append((entry.path, rel, ancestors | {key}))
+                continue
+            yield rel, False
+
+
+def _plan_copy(src: Path, ignore=None) -> tuple:
+    """Walk src once and return (dirs, files) as paths relative to src, in top-down order.
+    `ignore` follows the shutil.copytree convention: ignore(dir, names) -> names to skip.
+    """
+    rel_dirs = [""]
+    rel_files = []
+    for rel, is_dir in _scan_tree(src, ignore):
+        (rel_dirs if is_dir else rel_files).append(rel)
+    return rel_dirs, rel_files
 
 
 def compute_directory_sha256(path: Path) -> str:
@@ -140,22 +520,45 @@ def load_games_config(config_path: Path) -> Dict[str, Any]:
                     "default_backup_path": "./backups"
                 }
             }
-            save_games_config(config_path, default_config)
+            try:
+                save_games_config(config_path, default_config)
+            except OSError as e:
+                print_error(f"Failed to save config file: {e}")
             return default_config
     except Exception as e:
         print_error(f"Failed to load config file: {e}")
         return {"games": {}, "settings": {"default_max_backups": 10}}
 
+def config_signature(config: Dict[str, Any]) -> bytes:
+    """Short digest of a config's content, for telling whether a write would change anything."""
+    data = json.dumps(config, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 def save_games_config(config_path: Path, config: Dict[str, Any]):
-    """Save games configuration to JSON file"""
+    """Save games configuration to JSON file.
+    Writes a temp file next to it and renames it over the original, so a crash
+    mid-write never leaves a truncated config behind. Raises OSError if the write fails.
+    """
+    config_path = Path(config_path)
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print_error(f"Failed to save config file: {e}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
 
+@lru_cache(maxsize=256)
 def expand_path(path_str: str) -> str:
-    """Expand environment variables and user paths"""
+    """Expand environment variables and user paths.
+    Cached: the environment doesn't change while the app runs.
+    """
     # Expand environment variables
     expanded = os.path.expandvars(path_str)
     # Expand user home directory
@@ -208,28 +611,37 @@ def select_game(config: Dict[str, Any]) -> Optional[tuple]:
         print_error("Invalid input.")
         return None
 
-def add_game_to_config(config_path: Path, config: Dict[str, Any]):
+# Characters a game ID can't contain: it names the game's backup folder and is passed
+# on the command line, so whitespace and Windows filename characters are out
+GAME_ID_FORBIDDEN_CHARS = ' \t\n\r/\\:*?"<>|'
+_GAME_ID_FORBIDDEN = str.maketrans("", "", GAME_ID_FORBIDDEN_CHARS)
+
+def is_valid_game_id(game_id: str) -> bool:
+    """True if game_id is non-empty and free of GAME_ID_FORBIDDEN_CHARS."""
+    return bool(game_id) and game_id.translate(_GAME_ID_FORBIDDEN) == game_id
+
+def add_game_to_config(config_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
     """Interactive function to add a new game to config"""
     print_header("Add New Game")
     
     game_id = get_user_input_with_prompt("Game ID (short name, no spaces)")
-    if not game_id or ' ' in game_id:
-        print_error("Invalid game ID. Must not contain spaces.")
-        return
+    if not is_valid_game_id(game_id):
+        print_error('Invalid game ID. Must not contain spaces or any of / \\ : * ? " < > |')
+        return config
     
     if game_id in config.get("games", {}):
         print_error(f"Game '{game_id}' already exists in config.")
-        return
+        return config
     
     name = get_user_input_with_prompt("Game name")
     if not name:
         print_error("Game name is required.")
-        return
+        return config
     
     save_path = get_user_input_with_prompt("Save directory path")
     if not save_path:
         print_error("Save path is required.")
-        return
+        return config
     
     backup_path = get_user_input_with_prompt("Backup directory path (optional)")
     
@@ -242,7 +654,7 @@ def add_game_to_config(config_path: Path, config: Dict[str, Any]):
         confirm = input(f"{Colors.YELLOW}Add anyway? (y/N): {Colors.END}")
         if confirm.lower() != 'y':
             print_info("Game not added.")
-            return
+            return config
     
     # Add to config
     if "games" not in config:
@@ -255,15 +667,20 @@ def add_game_to_config(config_path: Path, config: Dict[str, Any]):
         "description": description
     }
     
-    save_games_config(config_path, config)
+    try:
+        save_games_config(config_path, config)
+    except OSError as e:
+        print_error(f"Failed to save config file: {e}")
+        return config
     print_success(f"Game '{name}' added to config!")
+    return config
 
-def edit_game_config(config_path: Path, config: Dict[str, Any]):
+def edit_game_config(config_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
     """Interactive function to edit a game in config"""
     games = list_games(config)
     if not games:
         print_warning("No games configured.")
-        return
+        return config
     
     print_header("Edit Game Configuration")
     
@@ -275,12 +692,12 @@ def edit_game_config(config_path: Path, config: Dict[str, Any]):
     try:
         choice = input(f"\n{Colors.YELLOW}Select game to edit (1-{len(games)}) or 'q' to quit: {Colors.END}")
         if choice.lower() == 'q':
-            return
+            return config
         
         choice = int(choice) - 1
         if not (0 <= choice < len(games)):
             print_error("Invalid choice.")
-            return
+            return config
         
         game_id, game_info = games[choice]
         
@@ -305,13 +722,16 @@ def edit_game_config(config_path: Path, config: Dict[str, Any]):
         
     except (ValueError, IndexError):
         print_error("Invalid input.")
+    except OSError as e:
+        print_error(f"Failed to save config file: {e}")
+    return config
 
-def remove_game_from_config(config_path: Path, config: Dict[str, Any]):
+def remove_game_from_config(config_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
     """Interactive function to remove a game from config"""
     games = list_games(config)
     if not games:
         print_warning("No games configured.")
-        return
+        return config
     
     print_header("Remove Game")
     
@@ -323,12 +743,12 @@ def remove_game_from_config(config_path: Path, config: Dict[str, Any]):
     try:
         choice = input(f"\n{Colors.YELLOW}Select game to remove (1-{len(games)}) or 'q' to quit: {Colors.END}")
         if choice.lower() == 'q':
-            return
+            return config
         
         choice = int(choice) - 1
         if not (0 <= choice < len(games)):
             print_error("Invalid choice.")
-            return
+            return config
         
         game_id, game_info = games[choice]
         game_name = game_info.get("name", game_id)
@@ -336,7 +756,7 @@ def remove_game_from_config(config_path: Path, config: Dict[str, Any]):
         confirm = input(f"\n{Colors.RED}Are you sure you want to remove '{game_name}'? (y/N): {Colors.END}")
         if confirm.lower() != 'y':
             print_info("Removal cancelled.")
-            return
+            return config
         
         del config["games"][game_id]
         save_games_config(config_path, config)
@@ -344,14 +764,52 @@ def remove_game_from_config(config_path: Path, config: Dict[str, Any]):
         
     except (ValueError, IndexError):
         print_error("Invalid input.")
+    except OSError as e:
+        print_error(f"Failed to save config file: {e}")
+    return config
+
+def _process_alive(pid: int) -> bool:
+    """True if a process with this PID is running (or might be; when unsure, say yes)"""
+    if pid == os.getpid():
+        return True
+    if os.name == 'nt':
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # Access denied means it exists; anything else means it doesn't
+            ERROR_ACCESS_DENIED = 5
+            return kernel32.GetLastError() == ERROR_ACCESS_DENIED
+        try:
+            code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return True
+            return code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
 
 class SaveBackupManager:
     def __init__(self, save_dir=None, backup_dir=None, max_backups=10, game_name=None,
                  skip_locked_files: bool = False, pre_backup_cmd: Optional[str] = None,
-                 post_backup_cmd: Optional[str] = None, retries: int = 3, retry_delay: float = 0.5):
+                 post_backup_cmd: Optional[str] = None, retries: int = 3, retry_delay: float = 0.5,
+                 compress: bool = False, dedupe: bool = False, copy_workers: Optional[int] = None):
         # Default to current directory if not specified
-        self.save_dir = Path(save_dir) if save_dir else Path.cwd()
-        self.backup_dir = Path(backup_dir) if backup_dir else self.save_dir / "backups"
+        # Absolute, so a restore that swaps out the working directory can't pull relative
+        # paths (e.g. the default "./backups") out from under us
+        self.save_dir = Path(save_dir).absolute() if save_dir else Path.cwd()
+        self.backup_dir = Path(backup_dir).absolute() if backup_dir else self.save_dir / "backups"
+        # With no game selected the save dir defaults to the working directory, which is
+        # usually the script's own folder; restores must leave the app's files alone there
+        self._script_path = Path(__file__).resolve()
+        self._holds_script = Path(os.path.realpath(self.save_dir)) in self._script_path.parents
         self.max_backups = max_backups
         self.game_name = game_name
         # New options for handling locked files and hooks
@@ -360,7 +818,26 @@ class SaveBackupManager:
         self.post_backup_cmd = post_backup_cmd
         self.retries = retries
         self.retry_delay = retry_delay
+        # Store new backups as a single compressed archive instead of a folder
+        self.compress = compress
+        # Hardlink files that are unchanged since the previous backup instead of copying them
+        self.dedupe = dedupe
+        # Number of parallel file copy/delete workers; None picks a default from the CPU count
+        self.copy_workers = copy_workers
+        # Worker pool shared by all parallel file operations of this manager (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Background backups, restore cleanup and the TUI can all ask for the pool at once
+        self._executor_lock = threading.Lock()
+        # Last backup dir scan as (dir mtime_ns, entries); dropped whenever we add or remove a backup
+        self._backup_scan: Optional[tuple] = None
         
+        # An interrupted restore can leave the save directory (and a backups folder
+        # inside it) renamed aside; put it back before anything else touches it
+        try:
+            self._cleanup_restore_leftovers()
+        except Exception as e:
+            print_warning(f"Failed to check for interrupted restores: {e}")
+
         # Create backup directory if it doesn't exist
         self.backup_dir.mkdir(exist_ok=True)
 
@@ -396,6 +873,108 @@ class SaveBackupManager:
                 handle_remove_readonly(func, path, exc_info)
             shutil.rmtree(path, onerror=handle_remove_readonly_old)
 
+    def _parallel_rmtree(self, path):
+        """Delete a directory tree, unlinking files on the worker pool and then removing
+        the emptied directories deepest first. Falls back to _safe_rmtree on any error.
+        """
+        error = self._parallel_rmtree_many([path]).get(os.fspath(path))
+        if error is not None:
+            raise error
+
+    def _parallel_rmtree_many(self, paths) -> Dict[str, Exception]:
+        """Delete several directory trees with one batch of parallel unlinks, so small
+        trees share the pool too. Returns {path: error} for trees that could not be removed.
+        """
+        errors: Dict[str, Exception] = {}
+        files = []
+        trees = []  # (root, dirs in top-down order, junctions inside the tree)
+        for path in map(os.fspath, paths):
+            if os.path.islink(path) or os.path.isjunction(path):
+                # Never walk through a link; rmtree knows how to handle (or refuse) it
+                trees.append((path, None, None))
+                continue
+            tree_files, dirs, junctions = [], [], []
+            stack = [path]
+            try:
+                while stack:
+                    current = stack.pop()
+                    dirs.append(current)
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            if entry.is_junction():
+                                # is_dir(follow_symlinks=False) is True for Windows junctions;
+                                # walking in would delete files outside the tree
+                                junctions.append(entry.path)
+                            elif entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            else:
+                                tree_files.append(entry.path)
+            except OSError:
+                # Let the slow path deal with (or report) anything we can't even list
+                trees.append((path, None, None))
+                continue
+            files.extend(tree_files)
+            trees.append((path, dirs, junctions))
+
+        def unlink_one(file_path):
+            try:
+                os.unlink(file_path)
+            except PermissionError:
+                # Read-only files (common on Windows)
+                os.chmod(file_path, 0o777)
+                os.unlink(file_path)
+
+        # Thread hand-off costs more than it saves on small batches
+        if len(files) >= 64:
+            try:
+                list(self._get_executor().map(unlink_one, files))
+            except OSError:
+                pass  # Leftovers make rmdir fail below and are retried the slow way
+
+        for root, dirs, junctions in trees:
+            try:
+                if dirs is None or len(files) < 64:
+                    self._safe_rmtree(root)
+                    continue
+                try:
+                    for junction in junctions:
+                        os.rmdir(junction)  # removes the link, not its target
+                    for directory in reversed(dirs):
+                        os.rmdir(directory)
+                except OSError:
+                    # Whatever is left (odd permissions, dir symlinks on Windows) goes the slow way
+                    self._safe_rmtree(root)
+            except Exception as e:
+                errors[root] = e
+        return errors
+
+    def _remove_backup(self, path):
+        """Delete a backup, whether it is a folder or a single archive file"""
+        self._backup_scan = None
+        if is_archive_backup(path):
+            os.unlink(path)
+        else:
+            self._parallel_rmtree(path)
+
+    def _remove_backups(self, paths: List[str]) -> Dict[str, Optional[Exception]]:
+        """Delete several backups in one parallel batch; returns {path: error or None}"""
+        self._backup_scan = None
+        results: Dict[str, Optional[Exception]] = {}
+        folders = []
+        for path in paths:
+            if is_archive_backup(path):
+                try:
+                    os.unlink(path)
+                    results[path] = None
+                except OSError as e:
+                    results[path] = e
+            else:
+                folders.append(path)
+        errors = self._parallel_rmtree_many(folders)
+        for path in folders:
+            results[path] = errors.get(os.fspath(path))
+        return {path: results[path] for path in paths}
+
     def _run_hook(self, cmd: Optional[str], when: str = "pre"):
         """Run a pre/post backup command if configured."""
         if not cmd:
@@ -450,13 +1029,18 @@ class SaveBackupManager:
             pass
         return True
 
-    def _safe_copy(self, src: str, dst: str, follow_symlinks=True) -> None:
-        """Copy a single file with retries and Windows fallback for locked files."""
+    def _safe_copy(self, src: str, dst: str, follow_symlinks=True) -> bool:
+        """Copy a single file with retries and Windows fallback for locked files.
+        Returns False if the file was skipped because it stayed locked.
+        """
         last_err = None
         for attempt in range(1, max(1, self.retries) + 1):
             try:
-                shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
-                return
+                if follow_symlinks:
+                    _fast_copyfile(src, dst)
+                else:
+                    shutil.copy2(src, dst, follow_symlinks=False)
+                return True
             except (PermissionError, OSError) as e:
                 last_err = e
                 # Try Windows-specific fallback to read locked files
@@ -464,7 +1048,7 @@ class SaveBackupManager:
                     try:
                         ok = self._win_read_file_to_path(src, dst)
                         if ok:
-                            return
+                            return True
                     except Exception:
                         pass
 
@@ -474,17 +1058,128 @@ class SaveBackupManager:
                 # If configured to skip locked files, warn and return without raising
                 if self.skip_locked_files:
                     print_warning(f"Skipping locked file: {src} -> {dst} ({last_err})")
-                    return
+                    return False
                 # Re-raise the last error if we exhausted retries
                 raise
     
-    def _get_save_size(self) -> str:
-        """Get the size of the save directory"""
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the manager's worker pool, reusing its threads across operations.
+        Idle workers exit on their own once the manager is garbage collected.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                if self.copy_workers:
+                    max_workers = max(1, int(self.copy_workers))
+                else:
+                    # Cap workers to keep the number of open descriptors bounded
+                    max_workers = min(8, (os.cpu_count() or 1) * 2)
+                self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sbm")
+            return self._executor
+
+    def _parallel_copytree(self, src: Path, dst: Path, ignore=None, prefix: str = "Copying files",
+                           plan: Optional[tuple] = None, manifest: Optional[dict] = None,
+                           link_dest: Optional[tuple] = None) -> int:
+        """Copy a directory tree file-by-file on a thread pool so per-file open/close
+        latency overlaps. Directories are created up front; returns the number of files copied.
+        Pass a plan from _plan_copy to reuse an earlier traversal of src.
+
+        If `manifest` is given it is filled with {relpath: [size, mtime_ns]} of the files that
+        made it into dst (locked files that were skipped are left out).
+        `link_dest` is a (backup_path, manifest) pair from a previous backup: files whose size and
+        mtime match are hardlinked from it instead of copied.
+        """
+        rel_dirs, rel_files = plan if plan is not None else _plan_copy(src, ignore)
+
+        for rel in rel_dirs:
+            os.makedirs(os.path.join(dst, rel), exist_ok=True)
+
+        if not rel_files:
+            return 0
+
+        progress = _ProgressCounter(len(rel_files), prefix)
+        linked = 0
+        prev_path, prev_manifest = link_dest if link_dest else (None, {})
+
+        link_lock = threading.Lock()
+        links_supported = True
+
+        def copy_one(rel):
+            nonlocal linked, links_supported
+            src_file = os.path.join(src, rel)
+            dst_file = os.path.join(dst, rel)
+            key = None
+            if manifest is not None or prev_manifest:
+                # Stat before copying so a file modified mid-copy looks changed next time
+                st = os.stat(src_file)
+                key = rel.replace(os.sep, '/')
+                stamp = [st.st_size, st.st_mtime_ns]
+                if manifest is not None:
+                    manifest[key] = stamp
+                if links_supported and prev_manifest.get(key) == stamp:
+                    try:
+                        os.link(os.path.join(prev_path, rel), dst_file)
+                        with link_lock:
+                            linked += 1
+                        progress.tick()
+                        return
+                    except OSError as e:
+                        # Missing in the old backup or too many links: copy this one instead.
+                        # If the filesystem can't hardlink at all (FAT/exFAT, some network
+                        # shares), stop trying for the rest of this backup.
+                        if e.errno in _NO_HARDLINK_ERRNOS:
+                            links_supported = False
+            if not self._safe_copy(src_file, dst_file) and key is not None and manifest is not None:
+                manifest.pop(key, None)
+            progress.tick()
+
+        executor = self._get_executor()
+        futures = [executor.submit(copy_one, rel) for rel in rel_files]
         try:
-            size = get_directory_size(self.save_dir)
-            return format_file_size(size)
-        except Exception:
-            return "Unknown"
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop queued copies and let in-flight ones finish before the caller cleans up
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+        if linked:
+            print()  # New line after progress bar
+            print_info(f"Reused {linked} unchanged file(s) from the previous backup")
+        return len(rel_files)
+
+    def _latest_manifest(self) -> tuple:
+        """Return (path, files) for the newest folder backup that has a file manifest"""
+        for entry in self._scan_backups():
+            if is_archive_backup(entry.path):
+                continue
+            try:
+                data = json.loads(Path(entry.path, ".backup_manifest.json").read_text(encoding='utf-8'))
+                return entry.path, data.get("files", {})
+            except (OSError, ValueError):
+                continue
+        return None, {}
+    
+    def save_unchanged(self) -> bool:
+        """Return True if every save file still matches the newest folder backup's manifest
+        (same paths, sizes and modification times), i.e. a new backup would be identical"""
+        _, previous = self._latest_manifest()
+        if not previous:
+            return False
+        try:
+            rel_files = _plan_copy(self.save_dir, _ignore_save_junk)[1]
+        except OSError:
+            return False  # let the backup itself report the unreadable folder
+        if len(rel_files) != len(previous):
+            return False
+        for rel in rel_files:
+            try:
+                st = os.stat(os.path.join(self.save_dir, rel))
+            except OSError:
+                return False
+            if previous.get(rel.replace(os.sep, '/')) != [st.st_size, st.st_mtime_ns]:
+                return False
+        return True
     
     def _cleanup_old_backups(self):
         """Remove old backups if we exceed max_backups"""
@@ -492,18 +1187,45 @@ class SaveBackupManager:
         if len(backups) > self.max_backups:
             backups_to_delete = backups[self.max_backups:]
             print_warning(f"Cleaning up {len(backups_to_delete)} old backup(s)...")
-            for backup_path in backups_to_delete:
-                try:
-                    self._safe_rmtree(backup_path)
-                    backup_name = Path(backup_path).name
-                    print_info(f"Deleted old backup: {backup_name}")
-                except Exception as e:
-                    print_error(f"Failed to delete {backup_path}: {e}")
+            for backup_path, error in self._remove_backups(backups_to_delete).items():
+                if error is None:
+                    print_info(f"Deleted old backup: {Path(backup_path).name}")
+                else:
+                    print_error(f"Failed to delete {backup_path}: {error}")
     
+    def _scan_backups(self) -> List[os.DirEntry]:
+        """Scan the backup directory once and return backup entries, newest first.
+        The result is reused until the directory's mtime changes, so repeated calls within
+        one command (or a TUI refresh tick with nothing new) cost a single stat. A directory
+        changed in the last few seconds is always rescanned.
+        """
+        try:
+            mtime = os.stat(self.backup_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        cached = self._backup_scan
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        try:
+            with os.scandir(self.backup_dir) as it:
+                entries = [e for e in it if e.name.startswith("backup_")
+                           and (e.is_dir(follow_symlinks=False) or e.name.endswith(ARCHIVE_SUFFIXES))]
+        except FileNotFoundError:
+            return []
+        # Names carry a fixed-width creation timestamp, so they sort chronologically without a
+        # stat per entry; mtime would change whenever a backup is copied or synced
+        entries.sort(key=lambda e: e.name, reverse=True)
+        # FAT keeps 2 s mtimes and some network shares are as coarse, so a change made within
+        # the same tick leaves mtime untouched; only trust an mtime that is safely in the past
+        if abs(time.time_ns() - mtime) >= _SCAN_CACHE_MIN_AGE_NS:
+            self._backup_scan = (mtime, entries)
+        else:
+            self._backup_scan = None
+        return list(entries)
+
     def _get_backup_list(self) -> List[str]:
         """Get sorted list of backup directories"""
-        backup_pattern = self.backup_dir / "backup_*"
-        return sorted(glob.glob(str(backup_pattern)), reverse=True)
+        return [entry.path for entry in self._scan_backups()]
 
     def _recover_or_cleanup_tmp_dirs(self):
         """Detect leftover temp backup dirs (created with mkdtemp prefix '.backup_...') and
@@ -515,6 +1237,10 @@ class SaveBackupManager:
         for entry in self.backup_dir.iterdir():
             try:
                 if not entry.is_dir():
+                    # A leftover temp archive is always incomplete; archives are renamed into place once closed
+                    if entry.name.startswith('.backup_') and entry.name.endswith(ARCHIVE_SUFFIXES):
+                        print_info(f"Removing incomplete temp archive: {entry.name}")
+                        entry.unlink()
                     continue
                 name = entry.name
                 # Temp dirs created by mkdtemp use prefix f".{backup_name}."
@@ -563,8 +1289,7 @@ class SaveBackupManager:
                 # Write metadata for recovered backup
                 try:
                     checksum = compute_directory_sha256(final_path)
-                    total_size = get_directory_size(final_path)
-                    total_files = sum(len(files) for _, _, files in os.walk(final_path))
+                    total_files, total_size = get_directory_stats(final_path)
                     meta = {
                         "completed_at": datetime.datetime.now().isoformat(),
                         "checksum": checksum,
@@ -573,6 +1298,9 @@ class SaveBackupManager:
                         "move_method": move_method,
                         "recovered": True
                     }
+                    description = read_backup_description(final_path)
+                    if description:
+                        meta["description"] = description
                     meta_file = final_path / ".backup_meta.json"
                     meta_file.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding='utf-8')
                     print_success(f"Recovered backup: {final_base}")
@@ -588,17 +1316,15 @@ class SaveBackupManager:
         backup_name = f"backup_{timestamp}"
         backup_path = self.backup_dir / backup_name
         
-        save_size = self._get_save_size()
-        
         try:
             print_info(f"Creating backup: {backup_name}")
-            print_info(f"Save directory size: {save_size}")
             
             if description:
                 print_info(f"Description: {description}")
             
-            # Count files for progress
-            file_count = sum(len(files) for _, _, files in os.walk(self.save_dir))
+            # Walk the save directory once; the plan gives the file count and drives the copy
+            plan = _plan_copy(self.save_dir, _ignore_save_junk)
+            file_count = len(plan[1])
             if file_count == 0:
                 print_warning("No files found in save directory")
                 return None
@@ -608,34 +1334,27 @@ class SaveBackupManager:
             # Show progress during backup
             start_time = time.time()
             
-            def copy_with_progress(src, dst, *, follow_symlinks=True):
-                files_copied = getattr(copy_with_progress, 'counter', 0)
-                copy_with_progress.counter = files_copied + 1
-                show_progress(copy_with_progress.counter, file_count, "Copying files")
-                # Use safe copy that handles locked files and retries
-                try:
-                    self._safe_copy(src, dst, follow_symlinks=follow_symlinks)
-                    return dst
-                except Exception:
-                    # Re-raise to allow higher-level handler to catch and cleanup
-                    raise
+            if self.compress:
+                backup_path = self._create_archive_backup(backup_name, plan, description)
+                print()  # New line after progress bar
+                print_success(f"Backup created successfully in {time.time() - start_time:.1f}s")
+                print_info(f"Location: {backup_path}")
+                print_info(f"Backup size: {format_file_size(os.path.getsize(backup_path))}")
+                self._cleanup_old_backups()
+                return backup_path
             
             # Perform copy into a temporary directory inside the backups folder so
             # incomplete backups are never visible to listing/restore operations.
             tmp_dir = None
             try:
-                # Create a temp directory path (shutil.copytree requires dest to not exist)
-                # Use a hidden prefix so it's ignored by normal listings
+                # Create a temp directory; use a hidden prefix so it's ignored by normal listings
                 tmp_dir = Path(tempfile.mkdtemp(prefix=f".{backup_name}.", dir=str(self.backup_dir)))
 
-                # Copy into the temp directory
-                shutil.copytree(
-                    self.save_dir,
-                    tmp_dir,
-                    ignore=shutil.ignore_patterns("backups", "*.pyc", "__pycache__", "*.tmp"),
-                    copy_function=copy_with_progress,
-                    dirs_exist_ok=True
-                )
+                # Copy into the temp directory (files are copied in parallel)
+                manifest = {}
+                link_dest = self._latest_manifest() if self.dedupe else None
+                self._parallel_copytree(self.save_dir, tmp_dir, plan=plan, manifest=manifest,
+                                        link_dest=link_dest)
 
                 print()  # New line after progress bar
                 elapsed_time = time.time() - start_time
@@ -645,6 +1364,10 @@ class SaveBackupManager:
                     desc_file = tmp_dir / ".backup_description"
                     desc_file.write_text(description, encoding='utf-8')
 
+                # Record source file stats so later backups can detect unchanged files
+                manifest_file = tmp_dir / ".backup_manifest.json"
+                manifest_file.write_text(json.dumps({"files": manifest}, ensure_ascii=False), encoding='utf-8')
+
                 # Atomically move the completed temp dir to the final name.
                 # os.replace is atomic on the same filesystem; if we get EXDEV
                 # (cross-device link), fall back to shutil.move which copies
@@ -669,12 +1392,14 @@ class SaveBackupManager:
                     else:
                         raise
                 tmp_dir = None  # transferred ownership to final location
+                self._backup_scan = None
 
                 # After successful atomic move, compute checksum and write metadata
                 try:
                     checksum = compute_directory_sha256(backup_path)
-                    total_size = get_directory_size(backup_path)
-                    total_files = sum(len(files) for _, _, files in os.walk(backup_path))
+                    # The manifest already holds the stat of every file copied; no need to walk again
+                    total_files = len(manifest)
+                    total_size = sum(size for size, _ in manifest.values())
                     meta = {
                         "completed_at": datetime.datetime.now().isoformat(),
                         "checksum": checksum,
@@ -692,6 +1417,8 @@ class SaveBackupManager:
 
                 print_success(f"Backup created successfully in {elapsed_time:.1f}s")
                 print_info(f"Location: {backup_path}")
+                # Sized from the copy manifest; no separate walk of the save directory
+                print_info(f"Backup size: {format_file_size(sum(size for size, _ in manifest.values()))}")
 
             finally:
                 # Cleanup temp dir if something went wrong and it still exists
@@ -710,60 +1437,283 @@ class SaveBackupManager:
             print_error(f"Failed to create backup: {e}")
             return None
     
+    def _create_archive_backup(self, backup_name: str, plan: tuple, description: Optional[str]) -> Path:
+        """Write the planned save files into one compressed archive, renamed into place once complete"""
+        backup_path = self.backup_dir / f"{backup_name}.zip"
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{backup_name}.", suffix=".zip", dir=str(self.backup_dir))
+        os.close(fd)
+        rel_dirs, rel_files = plan
+        progress = _ProgressCounter(len(rel_files), "Compressing")
+        total_size = 0
+        archived = 0
+        try:
+            with open(tmp_name, 'wb', buffering=_ARCHIVE_CHUNK) as raw, \
+                    zipfile.ZipFile(raw, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+                for rel in rel_dirs:
+                    if rel:
+                        zf.mkdir(rel.replace(os.sep, '/'))
+                for rel in rel_files:
+                    info = self._archive_file(zf, os.path.join(self.save_dir, rel), rel.replace(os.sep, '/'))
+                    if info is not None:
+                        total_size += info.file_size
+                        archived += 1
+                    progress.tick()
+                if description:
+                    zf.writestr(".backup_description", description)
+                meta = {
+                    "completed_at": datetime.datetime.now().isoformat(),
+                    "files": archived,
+                    "size_bytes": total_size,
+                    "format": "zip"
+                }
+                if description:
+                    meta["description"] = description
+                zf.writestr(".backup_meta.json", json.dumps(meta, indent=2, ensure_ascii=False))
+            os.replace(tmp_name, backup_path)
+            self._backup_scan = None
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return backup_path
+
+    def _archive_file(self, zf: zipfile.ZipFile, src: str, arcname: str) -> Optional[zipfile.ZipInfo]:
+        """Add one file to an archive with the same retry/skip rules as _safe_copy"""
+        for attempt in range(1, max(1, self.retries) + 1):
+            try:
+                info = zipfile.ZipInfo.from_file(src, arcname)
+                if src.lower().endswith(_STORED_SUFFIXES):
+                    info.compress_type = zipfile.ZIP_STORED
+                else:
+                    info.compress_type = zf.compression
+                    info.compress_level = zf.compresslevel
+                with open(src, 'rb') as fsrc, zf.open(info, 'w') as fdst:
+                    shutil.copyfileobj(fsrc, fdst, _ARCHIVE_CHUNK)
+                return info
+            except (PermissionError, OSError) as e:
+                if attempt < self.retries:
+                    time.sleep(self.retry_delay * attempt)
+                    continue
+                if self.skip_locked_files:
+                    print_warning(f"Skipping locked file: {src} ({e})")
+                    return None
+                raise
+
+    def _extract_archive(self, backup_path: Path, dest: Path):
+        """Extract an archive backup into dest, restoring file modification times"""
+        with zipfile.ZipFile(backup_path) as zf:
+            members = [m for m in zf.infolist() if m.filename not in BACKUP_SIDECAR_FILES]
+            progress = _ProgressCounter(max(1, len(members)), "Restoring")
+            for member in members:
+                target = zf.extract(member, dest)
+                if not member.is_dir():
+                    mtime = time.mktime(member.date_time + (0, 0, -1))
+                    os.utime(target, (mtime, mtime))
+                progress.tick()
+
     def list_backups(self) -> List[str]:
         """List all available backups with enhanced formatting"""
-        backups = self._get_backup_list()
+        entries = self._scan_backups()
+        backups = [entry.path for entry in entries]
         
         if not backups:
             print_warning("No backups found.")
             return []
         
         print_header("Available Backups")
-        
-        for i, backup in enumerate(backups, 1):
-            backup_path = Path(backup)
-            backup_name = backup_path.name
+
+        lines = []
+        now = datetime.datetime.now()  # one clock read for every age in the list
+        for i, entry in enumerate(entries, 1):
+            backup_path = entry.path
+            backup_name = entry.name
             
             # Extract timestamp from backup name
-            timestamp_str = backup_name.replace("backup_", "")
-            try:
-                timestamp = datetime.datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Calculate age
-                age = datetime.datetime.now() - timestamp
-                if age.days > 0:
-                    age_str = f"{age.days} days ago"
-                elif age.seconds > 3600:
-                    age_str = f"{age.seconds // 3600} hours ago"
-                elif age.seconds > 60:
-                    age_str = f"{age.seconds // 60} minutes ago"
-                else:
-                    age_str = "Just now"
-                
-                # Get backup size
-                backup_size = format_file_size(get_directory_size(backup_path))
-                
-                # Check for description
-                desc_file = backup_path / ".backup_description"
-                description = ""
-                if desc_file.exists():
-                    try:
-                        description = f" - {desc_file.read_text(encoding='utf-8').strip()}"
-                    except Exception:
-                        pass
-                
-                print_colored(f"{i:2d}. ", Colors.CYAN, bold=True, end="")
-                print_colored(f"{backup_name}", Colors.WHITE, bold=True)
-                print_colored(f"    📅 {formatted_time} ({age_str})", Colors.BLUE, end="")
-                print_colored(f" - {backup_size}{description}", Colors.MAGENTA)
-                
-            except ValueError:
-                print_colored(f"{i:2d}. {backup_name}", Colors.WHITE)
-        
+            timestamp = parse_backup_timestamp(backup_name)
+            if timestamp is None:
+                lines.append(colorize(f"{i:2d}. {backup_name}", Colors.WHITE))
+                continue
+
+            formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+            
+            age_str = format_age(now - timestamp)
+            
+            # Size and description, from the backup's metadata when it has some
+            size_bytes, description = read_backup_info(backup_path)
+            backup_size = format_file_size(size_bytes)
+            if description:
+                description = f" - {description}"
+            
+            lines.append(colorize(f"{i:2d}. ", Colors.CYAN, bold=True)
+                         + colorize(backup_name, Colors.WHITE, bold=True))
+            lines.append(colorize(f"    📅 {formatted_time} ({age_str})", Colors.BLUE)
+                         + colorize(f" - {backup_size}{description}", Colors.MAGENTA))
+
+        # One write for the whole listing instead of several per backup
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
         return backups
     
-    def restore_backup(self, backup_choice: Optional[int] = None, skip_confirmation: bool = False) -> bool:
+    def _copy_backup_contents(self, backup_path: Path, dest: Path):
+        """Copy a backup's files into dest, leaving out its top-level bookkeeping files"""
+        if is_archive_backup(backup_path):
+            self._extract_archive(backup_path, dest)
+            return
+
+        backup_root = str(backup_path)
+
+        def skip_sidecars(directory, names):
+            # Sidecar files only live at the top level of a backup
+            return BACKUP_SIDECAR_FILES.intersection(names) if directory == backup_root else set()
+
+        self._parallel_copytree(backup_path, dest, ignore=skip_sidecars, prefix="Restoring")
+
+    def _restore_by_swap(self, backup_path: Path) -> bool:
+        """Stage the backup next to the save directory, then swap it into place with two
+        renames and delete the old tree on a background thread.
+        Returns False when a swap isn't possible (symlinked/mounted save dir, the working
+        directory or this script inside it, busy files, unwritable parent) so the caller can
+        restore in place.
+        """
+        save_dir = self.save_dir
+        if save_dir.is_symlink() or os.path.isjunction(save_dir) or os.path.ismount(save_dir):
+            return False
+        # Renaming away (and then deleting) our own working directory would leave the
+        # process in a deleted folder; restore in place instead
+        try:
+            cwd = Path(os.path.realpath(os.getcwd()))
+        except OSError:
+            return False
+        real_save_dir = Path(os.path.realpath(save_dir))
+        if cwd == real_save_dir or real_save_dir in cwd.parents or self._holds_script:
+            return False
+
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            # The PID in the name tells other managers whether this restore may still be running
+            staging = Path(tempfile.mkdtemp(prefix=f".{save_dir.name}.restore_{timestamp}_{os.getpid()}.",
+                                            dir=str(save_dir.parent)))
+        except OSError:
+            return False
+        old_dir = staging.with_name(staging.name + ".old")
+
+        try:
+            self._copy_backup_contents(backup_path, staging)
+            shutil.copymode(save_dir, staging)
+        except Exception:
+            # Nothing has been touched in the save directory yet
+            self._safe_rmtree(staging)
+            raise
+
+        try:
+            os.replace(save_dir, old_dir)
+        except OSError as e:
+            print_warning(f"Could not swap save directory ({e}); restoring in place")
+            self._safe_rmtree(staging)
+            return False
+
+        # The backups folder may live inside the save directory; carry it over
+        preserved = old_dir / "backups"
+        try:
+            if preserved.exists():
+                os.replace(preserved, staging / "backups")
+            os.replace(staging, save_dir)
+        except OSError:
+            # Put the original save directory back before reporting the failure
+            if (staging / "backups").exists() and not preserved.exists():
+                os.replace(staging / "backups", preserved)
+            os.replace(old_dir, save_dir)
+            self._safe_rmtree(staging)
+            raise
+
+        threading.Thread(target=self._remove_in_background, args=(old_dir,),
+                         name="restore-cleanup").start()
+        return True
+
+    def _remove_in_background(self, path: Path):
+        """Delete a directory tree off the critical path, logging failures"""
+        try:
+            self._parallel_rmtree(path)
+        except Exception as e:
+            print_warning(f"Failed to remove old save files at {path}: {e}")
+
+    def _cleanup_restore_leftovers(self):
+        """Deal with staging/old dirs left next to the save directory by an interrupted restore.
+        If the save directory is missing the restore died mid-swap: the original saves are put
+        back from the .old dir. Leftovers are only deleted once the save directory exists and
+        the process that made them is gone; restores still running are never touched.
+        """
+        pattern = re.compile(re.escape(f".{self.save_dir.name}.restore_") + r"\d{8}_\d{6}_(\d+)\.")
+        try:
+            with os.scandir(self.save_dir.parent) as it:
+                leftovers = [(e.path, int(m.group(1))) for e in it
+                             if (m := pattern.match(e.name)) and e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        leftovers = [path for path, pid in leftovers if not _process_alive(pid)]
+        if not leftovers:
+            return
+
+        if not os.path.lexists(self.save_dir):
+            # Prefer the original saves; a staging dir only holds the restored copy
+            old_dirs = [path for path in leftovers if path.endswith(".old")]
+            recovered = max(old_dirs or leftovers, key=os.path.getmtime)
+            os.replace(recovered, self.save_dir)
+            leftovers.remove(recovered)
+            print_warning(f"A restore was interrupted; put {os.path.basename(recovered)} back as {self.save_dir}")
+
+        for path in leftovers:
+            print_info(f"Removing leftover restore dir: {os.path.basename(path)}")
+            self._safe_rmtree(path)
+
+    def _restore_in_place(self, backup_path: Path) -> bool:
+        """Restore by deleting the current save files and copying the backup over them"""
+        # Remove current save files (except backup folder)
+        print_info("Removing current save files...")
+        protected = {"backups"}
+        if self._holds_script:
+            protected |= _APP_FILE_NAMES | {self._script_path.name}
+        items = [item for item in self.save_dir.iterdir() if item.name not in protected]
+        # Delete all top-level folders in one parallel batch; only failures go through the loop below
+        # Links (symlinks and Windows junctions) are removed as links below, never emptied
+        folders = [str(item) for item in items
+                   if item.is_dir() and not item.is_symlink() and not item.is_junction()]
+        failed = self._parallel_rmtree_many(folders)
+        removed = set(folders).difference(failed)
+        for item in items:
+            if str(item) in removed:
+                continue
+            try:
+                if item.is_junction():
+                    os.rmdir(item)  # removes the link, not its target
+                elif item.is_dir() and not item.is_symlink():
+                    self._safe_rmtree(item)
+                else:
+                    # Handle read-only files
+                    if not os.access(item, os.W_OK):
+                        os.chmod(item, 0o777)
+                    item.unlink()
+            except PermissionError as e:
+                print_warning(f"Could not remove {item.name}: {e}")
+                print_info("Trying alternative removal method...")
+                try:
+                    # Try using system command as fallback
+                    if item.is_dir():
+                        subprocess.run(['rmdir', '/s', '/q', str(item)], shell=True, check=False)
+                    else:
+                        subprocess.run(['del', '/f', '/q', str(item)], shell=True, check=False)
+                except Exception as fallback_error:
+                    print_error(f"Failed to remove {item.name}: {fallback_error}")
+                    return False
+
+        # Copy backup contents to save directory
+        self._copy_backup_contents(backup_path, self.save_dir)
+        return True
+
+    def restore_backup(self, backup_choice: Optional[int | str] = None, skip_confirmation: bool = False) -> bool:
         """Restore a backup to the save directory"""
         backups = self._get_backup_list()
         
@@ -787,6 +1737,12 @@ class SaveBackupManager:
             except (ValueError, IndexError):
                 print_error("Invalid input.")
                 return False
+        elif isinstance(backup_choice, str):
+            # A path from _get_backup_list(), e.g. the row selected in the TUI
+            if backup_choice not in backups:
+                print_error("Backup not found.")
+                return False
+            backup_path = backup_choice
         else:
             if backup_choice < 1 or backup_choice > len(backups):
                 print_error("Invalid backup number.")
@@ -800,13 +1756,9 @@ class SaveBackupManager:
         print_info(f"Selected backup: {backup_name}")
         
         # Check for description
-        desc_file = Path(backup_path) / ".backup_description"
-        if desc_file.exists():
-            try:
-                description = desc_file.read_text(encoding='utf-8').strip()
-                print_info(f"Description: {description}")
-            except Exception:
-                pass
+        description = read_backup_description(backup_path)
+        if description:
+            print_info(f"Description: {description}")
         
         # Confirm restoration (skip if requested)
         if not skip_confirmation:
@@ -821,51 +1773,10 @@ class SaveBackupManager:
             #print_info("Creating safety backup of current state...")
             #current_backup = self.create_backup("Pre-restore safety backup")
             
-            # Remove current save files (except backup folder)
-            print_info("Removing current save files...")
-            for item in self.save_dir.iterdir():
-                if item.name != "backups" and item != Path(__file__):
-                    try:
-                        if item.is_dir():
-                            self._safe_rmtree(item)
-                        else:
-                            # Handle read-only files
-                            if not os.access(item, os.W_OK):
-                                os.chmod(item, 0o777)
-                            item.unlink()
-                    except PermissionError as e:
-                        print_warning(f"Could not remove {item.name}: {e}")
-                        print_info("Trying alternative removal method...")
-                        try:
-                            # Try using system command as fallback
-                            if item.is_dir():
-                                subprocess.run(['rmdir', '/s', '/q', str(item)], shell=True, check=False)
-                            else:
-                                subprocess.run(['del', '/f', '/q', str(item)], shell=True, check=False)
-                        except Exception as fallback_error:
-                            print_error(f"Failed to remove {item.name}: {fallback_error}")
-                            return False
-            
-            # Copy backup contents to save directory
             print_info("Restoring backup files...")
-            backup_path_obj = Path(backup_path)
-            files_to_restore = sum(len(files) for _, _, files in os.walk(backup_path_obj))
-            
-            files_restored = 0
-            for item in backup_path_obj.iterdir():
-                if item.name == ".backup_description":
-                    continue
-                    
-                dest = self.save_dir / item.name
-                if item.is_dir():
-                    shutil.copytree(item, dest)
-                    # Count files in directory
-                    files_restored += sum(len(files) for _, _, files in os.walk(item))
-                else:
-                    shutil.copy2(item, dest)
-                    files_restored += 1
-                
-                show_progress(files_restored, files_to_restore, "Restoring")
+            if not self._restore_by_swap(Path(backup_path)):
+                if not self._restore_in_place(Path(backup_path)):
+                    return False
             
             print()  # New line after progress bar
             print_success(f"Backup '{backup_name}' restored successfully!")
@@ -877,7 +1788,7 @@ class SaveBackupManager:
             print_error(f"Failed to restore backup: {e}")
             return False
     
-    def delete_backup(self, backup_choice: Optional[int] = None, skip_confirmation: bool = False) -> bool:
+    def delete_backup(self, backup_choice: Optional[int | str] = None, skip_confirmation: bool = False) -> bool:
         """Delete a specific backup"""
         backups = self._get_backup_list()
         
@@ -901,6 +1812,12 @@ class SaveBackupManager:
             except (ValueError, IndexError):
                 print_error("Invalid input.")
                 return False
+        elif isinstance(backup_choice, str):
+            # A path from _get_backup_list(), e.g. the row selected in the TUI
+            if backup_choice not in backups:
+                print_error("Backup not found.")
+                return False
+            backup_path = backup_choice
         else:
             if backup_choice < 1 or backup_choice > len(backups):
                 print_error("Invalid backup number.")
@@ -921,7 +1838,7 @@ class SaveBackupManager:
                 return False
         
         try:
-            self._safe_rmtree(backup_path)
+            self._remove_backup(backup_path)
             print_success(f"Backup '{backup_name}' deleted successfully!")
             return True
         except Exception as e:
@@ -946,13 +1863,11 @@ class SaveBackupManager:
             print_info("Cleanup cancelled.")
             return
         
-        for backup_path in backups_to_delete:
-            try:
-                self._safe_rmtree(backup_path)
-                backup_name = Path(backup_path).name
-                print_success(f"Deleted: {backup_name}")
-            except Exception as e:
-                print_error(f"Failed to delete {backup_path}: {e}")
+        for backup_path, error in self._remove_backups(backups_to_delete).items():
+            if error is None:
+                print_success(f"Deleted: {Path(backup_path).name}")
+            else:
+                print_error(f"Failed to delete {backup_path}: {error}")
 
 def get_user_input_with_prompt(prompt: str, default: Optional[str] = None) -> str:
     """Get user input with colored prompt"""
@@ -1023,6 +1938,9 @@ Examples:
     parser.add_argument("--skip-locked", action="store_true", help="Skip locked files instead of failing")
     parser.add_argument("--copy-retries", type=int, help="Number of copy retries for locked files")
     parser.add_argument("--retry-delay", type=float, help="Base delay (seconds) between retries")
+    parser.add_argument("--compress", action="store_true", help="Store new backups as a compressed archive")
+    parser.add_argument("--dedupe", action="store_true", help="Hardlink files unchanged since the previous backup")
+    parser.add_argument("--workers", type=int, help="Number of parallel file copy workers")
     parser.add_argument("-d", "--description", help="Description for the backup")
     parser.add_argument("--restore", type=int, help="Restore backup by number")
     parser.add_argument("--list", action="store_true", help="List all backups")
@@ -1050,56 +1968,48 @@ Examples:
     # Start monitoring config file for changes
     monitor_thread = monitor_config_file(config_path, reload_config)
     
-    # Handle config management
-    if args.config:
+    def list_configured_games():
+        games = list_games(config)
+        if games:
+            emit_menu((format_configured_games(games),))
+        else:
+            print_warning("No games configured.")
+
+    def edit_config(editor):
+        def handler():
+            nonlocal config
+            config = editor(config_path, config)
+        return handler
+
+    def open_config():
+        open_config_in_notepad(config_path)
+        print_info("Tip: The config file will be automatically reloaded when you save changes in Notepad")
+
+    config_handlers = {
+        "1": list_configured_games,
+        "2": edit_config(add_game_to_config),
+        "3": edit_config(edit_game_config),
+        "4": edit_config(remove_game_from_config),
+        "5": open_config,
+    }
+
+    def manage_config():
         while True:
-            print_header("Game Configuration Manager")
-            print_colored("1. 📋 List games", Colors.BLUE)
-            print_colored("2. ➕ Add game", Colors.GREEN)
-            print_colored("3. ✏️  Edit game", Colors.YELLOW)
-            print_colored("4. 🗑️  Remove game", Colors.RED)
-            print_colored("5. � Open config in Notepad", Colors.MAGENTA)
-            print_colored("6. �🚪 Back to main menu", Colors.WHITE)
-            
-            choice = input(f"\n{Colors.CYAN}Enter your choice (1-6): {Colors.END}").strip()
+            emit_menu((CONFIG_MENU,))
             
-            if choice == "1":
-                games = list_games(config)
-                if games:
-                    print_header("Configured Games")
-                    for i, (game_id, game_info) in enumerate(games, 1):
-                        name = game_info.get("name", game_id)
-                        save_path = game_info.get("save_path", "Unknown")
-                        backup_path = game_info.get("backup_path", "")
-                        description = game_info.get("description", "")
-                        
-                        print_colored(f"{i:2d}. {name} (ID: {game_id})", Colors.WHITE, bold=True)
-                        print_colored(f"    📁 Save: {save_path}", Colors.BLUE)
-                        if backup_path:
-                            print_colored(f"    💾 Backup: {backup_path}", Colors.GREEN)
-                        if description:
-                            print_colored(f"    📝 {description}", Colors.MAGENTA)
-                else:
-                    print_warning("No games configured.")
-            elif choice == "2":
-                add_game_to_config(config_path, config)
-                config = load_games_config(config_path)  # Reload
-            elif choice == "3":
-                edit_game_config(config_path, config)
-                config = load_games_config(config_path)  # Reload
-            elif choice == "4":
-                remove_game_from_config(config_path, config)
-                config = load_games_config(config_path)  # Reload
-            elif choice == "5":
-                open_config_in_notepad(config_path)
-                print_info("Tip: The config file will be automatically reloaded when you save changes in Notepad")
-            elif choice == "6":
+            choice = input(CONFIG_MENU_PROMPT).strip()
+            if choice == "6":
                 break
-            else:
+            handler = config_handlers.get(choice)
+            if handler is None:
                 print_error("Invalid choice. Please enter 1-6.")
-            
-            if choice in ["1", "2", "3", "4", "5"]:
-                input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
+                continue
+            handler()
+            input(CONTINUE_PROMPT)
+    
+    # Handle config management
+    if args.config:
+        manage_config()
     
     # Determine save directory and game info
     save_dir = args.save_dir
@@ -1150,13 +2060,20 @@ Examples:
     skip_locked = args.skip_locked or settings.get("skip_locked_files", False)
     copy_retries = args.copy_retries if args.copy_retries is not None else settings.get("copy_retries", 3)
     retry_delay = args.retry_delay if args.retry_delay is not None else settings.get("retry_delay", 0.5)
+    compress = args.compress or settings.get("compress_backups", False)
+    dedupe = args.dedupe or settings.get("dedupe_backups", False)
+    copy_workers = args.workers if args.workers is not None else settings.get("copy_workers")
+    # The same options apply to every manager built below, including after switching games
+    manager_options = dict(skip_locked_files=skip_locked,
+                           retries=copy_retries,
+                           retry_delay=retry_delay,
+                           compress=compress,
+                           dedupe=dedupe,
+                           copy_workers=copy_workers)
 
     # Initialize backup manager
     try:
-        manager = SaveBackupManager(save_dir, backup_dir, max_backups, game_name,
-                                    skip_locked_files=skip_locked,
-                                    retries=copy_retries,
-                                    retry_delay=retry_delay)
+        manager = SaveBackupManager(save_dir, backup_dir, max_backups, game_name, **manager_options)
     except Exception as e:
         print_error(f"Failed to initialize backup manager: {e}")
         sys.exit(1)
@@ -1175,114 +2092,123 @@ Examples:
             manager.cleanup_backups(args.keep)
         elif not args.config:
             # Interactive mode
+            # Backups from the menu run on their own thread so the prompt comes
+            # straight back; anything else that touches backups waits for them
+            backup_runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sbm-backup")
+            backup_events = queue.SimpleQueue()
+            last_backup = None
+
+            # Keep the background backup's progress and messages off the menu prompt
+            real_stdout = sys.stdout
+            background_output = _BackgroundOutput(real_stdout, threading.current_thread())
+            sys.stdout = background_output
+
+            def run_backup(backup_manager, description):
+                background_output.hold()
+                try:
+                    backup_events.put(("ok", backup_manager.create_backup(description)))
+                except Exception as e:
+                    backup_events.put(("error", str(e)))
+                finally:
+                    background_output.release()
+
+            def report_backups():
+                # Shown on the next menu redraw rather than whenever the backup ends
+                while True:
+                    try:
+                        kind, detail = backup_events.get_nowait()
+                    except queue.Empty:
+                        break
+                    if kind == "error":
+                        print_error(f"Background backup failed: {detail}")
+                    elif detail:
+                        print_success(f"Background backup finished: {os.path.basename(detail)}")
+                    else:
+                        print_error("Background backup failed")
+                for line in background_output.take_problems():
+                    (print_error if line.startswith("✗") else print_warning)(line[1:].strip())
+
+            def start_backup():
+                nonlocal last_backup
+                description = get_user_input_with_prompt("Backup description (optional)")
+                # Repeated backups of an untouched save just burn disk space; a
+                # description means the user wants a labelled copy regardless
+                if not description and last_backup and not last_backup.done():
+                    # Compare against the backup still being written, not the one before it
+                    print_info("Waiting for the background backup to finish...")
+                    last_backup.result()
+                    report_backups()
+                if not description and manager.save_unchanged():
+                    print_info("No changes since the last backup; skipped")
+                    return
+                last_backup = backup_runner.submit(run_backup, manager,
+                                                   description if description else None)
+                print_info("Backup started in the background")
+
+            def cleanup():
+                keep_count = get_user_input_with_prompt("Number of backups to keep", str(manager.max_backups))
+                try:
+                    keep_count = int(keep_count)
+                    manager.cleanup_backups(keep_count)
+                except ValueError:
+                    print_error("Invalid number entered.")
+
+            def switch_game():
+                nonlocal manager, game_line
+                selected = select_game(config)
+                if not selected:
+                    return
+                game_id, game_info = selected
+                new_save_dir = expand_path(game_info["save_path"])
+                new_game_name = game_info["name"]
+                # Determine new backup directory
+                new_backup_dir = args.backup_dir
+                if not new_backup_dir and "backup_path" in game_info and game_info["backup_path"]:
+                    new_backup_dir = expand_path(game_info["backup_path"])
+                elif not new_backup_dir:
+                    default_backup_path = config.get("settings", {}).get("default_backup_path")
+                    if default_backup_path:
+                        new_backup_dir = expand_path(default_backup_path)
+                
+                if os.path.exists(new_save_dir):
+                    manager = SaveBackupManager(new_save_dir, new_backup_dir, max_backups, new_game_name,
+                                                **manager_options)
+                    game_line = format_current_game(new_game_name)
+                    print_success(f"Switched to: {new_game_name}")
+                else:
+                    print_error(f"Save directory does not exist: {new_save_dir}")
+
+            menu_handlers = {
+                "1": start_backup,
+                "2": lambda: manager.list_backups(),
+                "3": lambda: manager.restore_backup(),
+                "4": lambda: manager.delete_backup(),
+                "5": cleanup,
+                "6": switch_game,
+                "7": manage_config,
+            }
+
+            game_line = format_current_game(game_name)
             while True:
-                print_header("Main Menu")
-                if game_name:
-                    print_colored(f"🎮 Current Game: ", Colors.CYAN, bold=True, end="")
-                    print_colored(f"{game_name}\n", Colors.WHITE, bold=True)
-                print_colored("1. 💾 Create backup", Colors.GREEN)
-                print_colored("2. 📋 List backups", Colors.BLUE)
-                print_colored("3. 🔄 Restore backup", Colors.YELLOW)
-                print_colored("4. 🗑️ Delete backup", Colors.RED)
-                print_colored("5. 🧹 Cleanup old backups", Colors.MAGENTA)
-                print_colored("6. 🎮 Switch game", Colors.CYAN)
-                print_colored("7. ⚙️ Manage games config", Colors.WHITE)
-                print_colored("8. 🚪 Exit", Colors.WHITE)
+                report_backups()
+                emit_menu((MAIN_MENU_HEADER, game_line, MAIN_MENU_OPTIONS))
                 
                 try:
-                    choice = input(f"\n{Colors.CYAN}Enter your choice (1-8): {Colors.END}").strip()
-                    
-                    if choice == "1":
-                        description = get_user_input_with_prompt("Backup description (optional)")
-                        manager.create_backup(description if description else None)
-                    elif choice == "2":
-                        manager.list_backups()
-                    elif choice == "3":
-                        manager.restore_backup()
-                    elif choice == "4":
-                        manager.delete_backup()
-                    elif choice == "5":
-                        keep_count = get_user_input_with_prompt("Number of backups to keep", str(manager.max_backups))
-                        try:
-                            keep_count = int(keep_count)
-                            manager.cleanup_backups(keep_count)
-                        except ValueError:
-                            print_error("Invalid number entered.")
-                    elif choice == "6":
-                        selected = select_game(config)
-                        if selected:
-                            game_id, game_info = selected
-                            new_save_dir = expand_path(game_info["save_path"])
-                            new_game_name = game_info["name"]
-                            # Determine new backup directory
-                            new_backup_dir = args.backup_dir
-                            if not new_backup_dir and "backup_path" in game_info and game_info["backup_path"]:
-                                new_backup_dir = expand_path(game_info["backup_path"])
-                            elif not new_backup_dir:
-                                default_backup_path = config.get("settings", {}).get("default_backup_path")
-                                if default_backup_path:
-                                    new_backup_dir = expand_path(default_backup_path)
-                            
-                            if os.path.exists(new_save_dir):
-                                manager = SaveBackupManager(new_save_dir, new_backup_dir, max_backups, new_game_name)
-                                print_success(f"Switched to: {new_game_name}")
-                            else:
-                                print_error(f"Save directory does not exist: {new_save_dir}")
-                    elif choice == "7":
-                        # Jump to config management
-                        while True:
-                            print_header("Game Configuration Manager")
-                            print_colored("1. 📋 List games", Colors.BLUE)
-                            print_colored("2. ➕ Add game", Colors.GREEN)
-                            print_colored("3. ✏️  Edit game", Colors.YELLOW)
-                            print_colored("4. 🗑️  Remove game", Colors.RED)
-                            print_colored("5. 📝 Open config in Notepad", Colors.MAGENTA)
-                            print_colored("6. 🚪 Back to main menu", Colors.WHITE)
-                            
-                            config_choice = input(f"\n{Colors.CYAN}Enter your choice (1-6): {Colors.END}").strip()
-                            
-                            if config_choice == "1":
-                                games = list_games(config)
-                                if games:
-                                    print_header("Configured Games")
-                                    for i, (game_id, game_info) in enumerate(games, 1):
-                                        name = game_info.get("name", game_id)
-                                        save_path = game_info.get("save_path", "Unknown")
-                                        backup_path = game_info.get("backup_path", "")
-                                        description = game_info.get("description", "")
-                                        
-                                        print_colored(f"{i:2d}. {name} (ID: {game_id})", Colors.WHITE, bold=True)
-                                        print_colored(f"    📁 Save: {save_path}", Colors.BLUE)
-                                        if backup_path:
-                                            print_colored(f"    💾 Backup: {backup_path}", Colors.GREEN)
-                                        if description:
-                                            print_colored(f"    📝 {description}", Colors.MAGENTA)
-                                else:
-                                    print_warning("No games configured.")
-                            elif config_choice == "2":
-                                add_game_to_config(config_path, config)
-                                config = load_games_config(config_path)  # Reload
-                            elif config_choice == "3":
-                                edit_game_config(config_path, config)
-                                config = load_games_config(config_path)  # Reload
-                            elif config_choice == "4":
-                                remove_game_from_config(config_path, config)
-                                config = load_games_config(config_path)  # Reload
-                            elif config_choice == "5":
-                                open_config_in_notepad(config_path)
-                                print_info("Tip: The config file will be automatically reloaded when you save changes in Notepad")
-                            elif config_choice == "6":
-                                break
-                            else:
-                                print_error("Invalid choice. Please enter 1-6.")
-                            
-                            if config_choice in ["1", "2", "3", "4", "5"]:
-                                input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
-                    elif choice == "8":
+                    choice = input(MAIN_MENU_PROMPT).strip()
+
+                    if last_backup and not last_backup.done() and choice in ("2", "3", "4", "5", "6", "8"):
+                        print_info("Waiting for the background backup to finish...")
+                        last_backup.result()
+                    report_backups()
+
+                    if choice == "8":
                         print_success("Thanks for using Save Game Backup Manager! 👋")
                         break
-                    else:
+                    handler = menu_handlers.get(choice)
+                    if handler is None:
                         print_error("Invalid choice. Please enter 1-8.")
+                    else:
+                        handler()
                         
                 except KeyboardInterrupt:
                     print_success("\nThanks for using Save Game Backup Manager! 👋")
@@ -1291,8 +2217,12 @@ Examples:
                     print_error(f"An error occurred: {e}")
                 
                 # Pause before showing menu again
-                if choice not in ["7", "8"]:
-                    input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
+                if choice not in ["1", "7"]:
+                    input(CONTINUE_PROMPT)
+
+            backup_runner.shutdown()
+            sys.stdout = real_stdout
+            report_backups()
                 
     except KeyboardInterrupt:
         print_success("\nThanks for using Save Game Backup Manager! 👋")
@@ -5,9 +5,12 @@ A terminal user interface for the backup.py CLI tool using Textual
 """
 
 import os
+import re
 import sys
 import threading
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Text
 import asyncio
@@ -17,14 +20,14 @@ from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
-    Header, Footer, Button, Select, Static, Input, TextArea, 
+    Header, Footer, Button, Select, Static, Input, 
     DataTable, Label,
     TabbedContent, TabPane
 )
 from textual.binding import Binding
 from textual.message import Message
 from textual.screen import ModalScreen
-from textual import on
+from textual import events, on
 from textual.validation import Number
 from textual.reactive import reactive
 
@@ -33,13 +36,31 @@ from backup import (
     SaveBackupManager, 
     load_games_config, 
     save_games_config, 
+    config_signature,
+    is_valid_game_id,
+    GAME_ID_FORBIDDEN_CHARS,
     expand_path,
     list_games,
     format_file_size,
-    get_directory_size
+    format_age,
+    print_error,
+    read_backup_info,
+    read_backup_description,
+    parse_backup_timestamp
 )
 
 
+@lru_cache(maxsize=1024)
+def _backup_date_time(timestamp: datetime.datetime) -> tuple:
+    """Date and time columns for a backup timestamp. A backup's name (and so its
+    timestamp) never changes, so each refresh only has to format new backups."""
+    return timestamp.strftime("%Y-%m-%d"), timestamp.strftime("%H:%M:%S")
+
+
+# Input restriction that stops forbidden game ID characters as they are typed
+_GAME_ID_RESTRICT = "[^" + re.escape(GAME_ID_FORBIDDEN_CHARS) + "]*"
+
+
 class ConfirmDialog(ModalScreen[bool]):
     """A modal confirmation dialog."""
     
@@ -104,6 +125,16 @@ class ConfirmDialog(ModalScreen[bool]):
 
 class GameConfigDialog(ModalScreen[Optional[tuple]]):
     """Modal dialog for adding/editing game configuration."""
+
+    # (input id, game config key, label, placeholder) for the text fields, in display
+    # order. The game ID has no config key: it is the key of the game's entry.
+    FIELDS = [
+        ("game_id", None, "Game ID (short name, no spaces):", "e.g., grim_dawn"),
+        ("game_name", "name", "Game Name:", "e.g., Grim Dawn"),
+        ("save_path", "save_path", "Save Directory Path:", "e.g., C:/Users/Username/Documents/My Games/Grim Dawn/save"),
+        ("backup_path", "backup_path", "Backup Directory Path (optional):", "Leave empty to use default"),
+        ("description", "description", "Description (optional):", "e.g., Steam version, main character"),
+    ]
     
     def __init__(self, title: str, game_id: str = "", game_info: Optional[Dict] = None):
         super().__init__()
@@ -112,42 +143,18 @@ class GameConfigDialog(ModalScreen[Optional[tuple]]):
         self.game_info = game_info or {}
     
     def compose(self) -> ComposeResult:
+        fields = []
+        for input_id, key, label, placeholder in self.FIELDS:
+            fields.append(Label(label))
+            if key is None:
+                # The ID is the config key itself; reject bad characters as they are typed
+                fields.append(Input(value=self.game_id, placeholder=placeholder, restrict=_GAME_ID_RESTRICT, id=input_id))
+            else:
+                fields.append(Input(value=self.game_info.get(key, ""), placeholder=placeholder, id=input_id))
+
         yield Container(
             Static(self.dialog_title, classes="dialog-title"),
-            
-            Label("Game ID (short name, no spaces):"),
-            Input(
-                value=self.game_id,
-                placeholder="e.g., grim_dawn",
-                id="game_id"
-            ),
-            
-            Label("Game Name:"),
-            Input(
-                value=self.game_info.get("name", ""),
-                placeholder="e.g., Grim Dawn",
-                id="game_name"
-            ),
-            
-            Label("Save Directory Path:"),
-            Input(
-                value=self.game_info.get("save_path", ""),
-                placeholder="e.g., C:/Users/Username/Documents/My Games/Grim Dawn/save",
-                id="save_path"
-            ),
-            
-            Label("Backup Directory Path (optional):"),
-            Input(
-                value=self.game_info.get("backup_path", ""),
-                placeholder="Leave empty to use default",
-                id="backup_path"
-            ),
-            
-            Label("Description (optional):"),
-            TextArea(
-                text=self.game_info.get("description", ""),
-                id="description"
-            ),
+            *fields,
             # Per-game override settings
             Label("Per-game settings (leave blank to use global):"),
             Horizontal(
@@ -189,11 +196,9 @@ class GameConfigDialog(ModalScreen[Optional[tuple]]):
     
     @on(Button.Pressed, "#ok")
     def on_ok(self):
-        game_id = self.query_one("#game_id", Input).value.strip()
-        name = self.query_one("#game_name", Input).value.strip()
-        save_path = self.query_one("#save_path", Input).value.strip()
-        backup_path = self.query_one("#backup_path", Input).value.strip()
-        description = self.query_one("#description", TextArea).text.strip()
+        game_id, name, save_path, backup_path, description = (
+            self.query_one(f"#{input_id}", Input).value.strip() for input_id, *_ in self.FIELDS
+        )
 
         # Per-game overrides (read inside method scope)
         game_skip_locked_val = self.query_one("#game_skip_locked", Select).value
@@ -205,8 +210,8 @@ class GameConfigDialog(ModalScreen[Optional[tuple]]):
             self.notify("Game ID is required", severity="error")
             return
 
-        if ' ' in game_id:
-            self.notify("Game ID cannot contain spaces", severity="error")
+        if not is_valid_game_id(game_id):
+            self.notify('Game ID cannot contain spaces or any of / \\ : * ? " < > |', severity="error")
             return
 
         if not name:
@@ -217,6 +222,11 @@ class GameConfigDialog(ModalScreen[Optional[tuple]]):
             self.notify("Save path is required", severity="error")
             return
 
+        # Like the CLI, a missing save folder is only a warning (the game may not have
+        # saved yet). An unchanged path was accepted before, so don't stat it again.
+        if save_path != self.game_info.get("save_path") and not os.path.isdir(expand_path(save_path)):
+            self.notify(f"Save path does not exist yet: {expand_path(save_path)}", severity="warning")
+
         result = (game_id, {
             "name": name,
             "save_path": save_path,
@@ -254,8 +264,11 @@ class BackupManagerApp(App):
         Binding("8", "select_backup(8)", "Select Backup 8", show=False),
         Binding("9", "select_backup(9)", "Select Backup 9", show=False),
         Binding("0", "select_backup(10)", "Select Backup 10", show=False),
+        Binding("shift+delete", "remove_game_now", "Remove Game Without Confirmation", show=False),
     ]
     
+    MAX_CACHED_MANAGERS = 8
+    
     def __init__(self):
         super().__init__()
         self.title = "🎮 Save Game Backup Manager 🎮 "
@@ -271,6 +284,36 @@ class BackupManagerApp(App):
         self.current_game_info = None
         # Auto-refresh task handle
         self._auto_refresh_task = None
+        # Managers for recently selected games, least recently used first
+        self._managers: Dict[tuple, SaveBackupManager] = {}
+        # Pending debounced write of self.config (see _mark_config_dirty); writes run
+        # in order on a single background thread
+        self._config_flush_timer = None
+        self._config_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-writer")
+        # Signature of the config on disk (updated only after a write succeeds) and of the
+        # newest snapshot still waiting to be written, so unchanged saves skip the disk
+        self._config_sig = config_signature(self.config)
+        self._queued_config_sig = None
+        # Set on exit; a config write that fails then is reported by main() instead
+        self._closing = False
+        self.config_save_error: Optional[Exception] = None
+        # Bumped per submitted snapshot; the writer skips any that were superseded
+        # while it was busy with an earlier write
+        self._config_generation = 0
+        # Set when an auto-refresh tick was skipped because the list wasn't on screen
+        self._refresh_skipped = False
+        # A backup list scan is running / another one was requested while it ran
+        self._refresh_in_progress = False
+        self._refresh_queued = False
+        # Cell values shown in the backup table, keyed (and ordered) by backup path
+        self._backup_rows: Dict[str, tuple] = {}
+        self._backup_columns: List = []
+        self._games_columns: List = []
+        # (mtime_ns, (size_str, description)) per backup path; backups don't change once written
+        self._backup_info_cache: Dict[str, tuple] = {}
+        # Small pool for reading backup metadata. Kept apart from the managers' copy pools
+        # so a running backup or restore never holds up a list refresh.
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="backup-info")
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -411,11 +454,11 @@ class BackupManagerApp(App):
         """Initialize the application on mount."""
         # Setup table columns
         backup_table = self.query_one("#backup_table", DataTable)
-        backup_table.add_columns("Backup Name", "Date", "Time", "Age", "Size", "Description")
+        self._backup_columns = backup_table.add_columns("Backup Name", "Date", "Time", "Age", "Size", "Description")
         backup_table.cursor_type = "row"
         
         games_table = self.query_one("#games_table", DataTable)
-        games_table.add_columns("Game ID", "Name", "Save Path", "Backup Path", "Description")
+        self._games_columns = games_table.add_columns("Game ID", "Name", "Save Path", "Backup Path", "Description")
         games_table.cursor_type = "row"
     
         # Load data
@@ -464,8 +507,7 @@ class BackupManagerApp(App):
             self.manager = None
             self.update_game_info()
             # Clear backup list
-            table = self.query_one("#backup_table", DataTable)
-            table.clear()
+            self._clear_backup_table()
     
     def save_last_selected_game(self, game_id: str):
         """Save the last selected game to configuration."""
@@ -474,11 +516,72 @@ class BackupManagerApp(App):
                 self.config["settings"] = {}
             
             self.config["settings"]["last_selected_game"] = game_id
-            save_games_config(self.config_path, self.config)
+            self._mark_config_dirty()
         except Exception as e:
             # Don't show error to user, just log it silently
             pass
     
+    def _mark_config_dirty(self):
+        """Schedule a write of self.config. Changes made in quick succession (e.g. paging
+        through games, which records the last selection each time) share a single write."""
+        if self._config_flush_timer is None:
+            self._config_flush_timer = self.set_timer(0.5, self._flush_config)
+
+    def _flush_config(self):
+        """Hand a snapshot of self.config to the writer thread if it differs from what is
+        on disk (or already queued), so a slow or network drive never stalls the UI."""
+        if self._config_flush_timer is not None:
+            self._config_flush_timer.stop()
+            self._config_flush_timer = None
+        snapshot = self._config_snapshot()
+        sig = config_signature(snapshot)
+        if sig == (self._queued_config_sig if self._queued_config_sig is not None else self._config_sig):
+            return
+        self._queued_config_sig = sig
+        self._config_generation += 1
+        self._config_writer.submit(self._write_config, snapshot, sig, self._config_generation)
+
+    def _config_snapshot(self) -> Dict[str, Any]:
+        """Copy of self.config that the writer thread can own. Game entries and settings
+        hold only scalars, so copying two levels deep is enough (and cheaper than deepcopy)."""
+        snapshot = {key: dict(value) if isinstance(value, dict) else value for key, value in self.config.items()}
+        snapshot["games"] = {game_id: dict(info) for game_id, info in self.config.get("games", {}).items()}
+        return snapshot
+
+    def _write_config(self, config: Dict[str, Any], sig: bytes, generation: int):
+        """Write a config snapshot to disk. Runs on the writer thread."""
+        if generation != self._config_generation:
+            return  # a newer snapshot is queued behind this one
+        try:
+            save_games_config(self.config_path, config)
+        except Exception as e:
+            self.call_from_thread(self._config_write_failed, e)
+        else:
+            self.call_from_thread(self._config_written, sig)
+
+    def _config_written(self, sig: bytes):
+        """Record a successful config write."""
+        self._config_sig = sig
+        if self._queued_config_sig == sig:
+            self._queued_config_sig = None
+
+    def _config_write_failed(self, error: Exception):
+        """Report a failed config write; the change stays dirty and is retried on the next flush."""
+        self._queued_config_sig = None
+        if self._closing:
+            # The screen is going away; main() prints it once the terminal is back
+            self.config_save_error = error
+        else:
+            self.notify(f"Failed to save configuration: {error}", severity="error")
+
+    async def on_unmount(self):
+        """Don't lose a pending (or previously failed) config write when the app exits."""
+        self._closing = True
+        self._flush_config()
+        # Wait without blocking the event loop: the writer reports back through call_from_thread
+        await asyncio.get_running_loop().run_in_executor(None, self._config_writer.shutdown, True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+    
     def get_last_selected_game(self) -> str | None:
         """Get the last selected game from configuration."""
         return self.config.get("settings", {}).get("last_selected_game")
@@ -521,77 +624,133 @@ class BackupManagerApp(App):
             skip_locked = settings.get("skip_locked_files", False)
             copy_retries = settings.get("copy_retries", 3)
             retry_delay = settings.get("retry_delay", 0.5)
+            compress = settings.get("compress_backups", False)
+            dedupe = settings.get("dedupe_backups", False)
+            copy_workers = settings.get("copy_workers")
 
-            self.manager = SaveBackupManager(
+            options = dict(
                 save_dir=game_config["save_path"],
                 backup_dir=game_config.get("backup_path"),
                 max_backups=max_backups,
                 game_name=self.current_game_info.get("name"),
                 skip_locked_files=skip_locked,
                 retries=copy_retries,
-                retry_delay=retry_delay
+                retry_delay=retry_delay,
+                compress=compress,
+                dedupe=dedupe,
+                copy_workers=copy_workers
             )
+            # Switching back to a recent game reuses its manager (and its caches and pool)
+            key = tuple(options.values())
+            manager = self._managers.pop(key, None)
+            if manager is None:
+                manager = SaveBackupManager(**options)
+            self._managers[key] = manager
+            if len(self._managers) > self.MAX_CACHED_MANAGERS:
+                del self._managers[next(iter(self._managers))]  # least recently used
+            self.manager = manager
             
         except Exception as e:
             self.notify(f"Failed to initialize backup manager: {e}", severity="error")
             self.manager = None
     
     def refresh_backup_list(self):
-        """Refresh the backup list display."""
-        table = self.query_one("#backup_table", DataTable)
-        table.clear()
-        
-        if not self.manager:
+        """Refresh the backup list display.
+
+        The backup folder is read on a worker thread; only the table update runs on the UI thread.
+        """
+        self._refresh_skipped = False
+        manager = self.manager
+        if not manager:
+            self._clear_backup_table()
             return
+
+        if self._refresh_in_progress:
+            # One scan at a time; run once more when the current one finishes
+            self._refresh_queued = True
+            return
+        self._refresh_in_progress = True
+
+        def refresh_worker():
+            rows = None
+            try:
+                rows = self._collect_backup_rows(manager)
+            except Exception as e:
+                self.call_from_thread(self.notify, f"Failed to refresh backup list: {e}", severity="error")
+            finally:
+                self.call_from_thread(self._finish_refresh, manager, rows)
+
+        thread = threading.Thread(target=refresh_worker, daemon=True)
+        thread.start()
+
+    def _finish_refresh(self, manager: SaveBackupManager, rows: Optional[List[tuple]]):
+        """Apply a finished scan, then start the refresh that was requested meanwhile, if any."""
+        self._refresh_in_progress = False
+        if rows is not None:
+            self._apply_backup_rows(manager, rows)
+        if self._refresh_queued:
+            self._refresh_queued = False
+            self.refresh_backup_list()
+
+    def _collect_backup_rows(self, manager: SaveBackupManager) -> List[tuple]:
+        """Build the backup table's cell values, newest backup first. Runs off the UI thread."""
+        backups = manager._get_backup_list()
+        infos = self._collect_backup_info(backups)
+        rows = []
+        now = datetime.datetime.now()  # one clock read for every age in the list
         
-        try:
-            backups = self.manager._get_backup_list()
-            
-            for index, backup_path in enumerate(backups):
-                backup_path_obj = Path(backup_path)
-                backup_name = backup_path_obj.name            
-                               
-                # Parse timestamp from backup name
-                try:
-                    timestamp_str = backup_name.replace("backup_", "")
-                    timestamp = datetime.datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                    date_str = timestamp.strftime("%Y-%m-%d")
-                    time_str = timestamp.strftime("%H:%M:%S")
-                    
-                    # Calculate age
-                    age = datetime.datetime.now() - timestamp
-                    if age.days > 0:
-                        age_str = f"{age.days}d ago"
-                    elif age.seconds > 3600:
-                        hours = age.seconds // 3600
-                        age_str = f"{hours}h ago"
-                    else:
-                        minutes = age.seconds // 60
-                        age_str = f"{minutes}m ago"
-                        
-                except ValueError:
-                    date_str = "Unknown"
-                    time_str = "Unknown"
-                    age_str = "Unknown"
-                
-                # Get size
-                try:
-                    size = get_directory_size(backup_path_obj)
-                    size_str = format_file_size(size)
-                except Exception:
-                    size_str = "Unknown"
+        for backup_path, info in zip(backups, infos):
+            backup_name = os.path.basename(backup_path)
+                           
+            # Parse timestamp from backup name
+            timestamp = parse_backup_timestamp(backup_name)
+            if timestamp is not None:
+                date_str, time_str = _backup_date_time(timestamp)
                 
-                # Get description
-                desc_file = backup_path_obj / ".backup_description"
-                description = ""
-                if desc_file.exists():
-                    try:
-                        description = desc_file.read_text(encoding='utf-8').strip()
-                    except Exception:
-                        pass
+                age_str = format_age(now - timestamp, short=True)
+            else:
+                date_str = "Unknown"
+                time_str = "Unknown"
+                age_str = "Unknown"
+            
+            # Get size and description (read from backup metadata when available)
+            if info is not None:
+                size_str, description = info
+            else:
+                size_str = "Unknown"
+                description = read_backup_description(backup_path)
+
+            rows.append((backup_path, (backup_name, date_str, time_str, age_str, size_str, description)))
+        
+        # Forget backups that are gone (deleted, or from a previously selected game)
+        current = set(backups)
+        for stale in [path for path in list(self._backup_info_cache) if path not in current]:
+            self._backup_info_cache.pop(stale, None)
+        return rows
+
+    def _apply_backup_rows(self, manager: SaveBackupManager, rows: List[tuple]):
+        """Fill the backup table with rows collected by refresh_backup_list."""
+        if manager is not self.manager:
+            # The game was switched while the list was being read
+            return
+        table = self.query_one("#backup_table", DataTable)
 
+        if [path for path, _ in rows] == list(self._backup_rows):
+            # Same backups as last time (the usual auto-refresh tick): update changed
+            # cells in place - normally just the age - and leave the cursor alone
+            for path, cells in rows:
+                old_cells = self._backup_rows[path]
+                for column_key, old, new in zip(self._backup_columns, old_cells, cells):
+                    if old != new:
+                        table.update_cell(path, column_key, new)
+            self._backup_rows = dict(rows)
+            return
 
-                 # Add position number for first 10 backups in separate column
+        # Hold screen updates so the table repaints once, not once per row
+        with self.batch_update():
+            table.clear()
+            for index, (path, cells) in enumerate(rows):
+                # Add position number for first 10 backups in separate column
                 if index < 9:
                     position = str(index + 1)
                 elif index == 9:
@@ -601,16 +760,46 @@ class BackupManagerApp(App):
                 label = Text(str(position), style="#B0FC38 italic")  # type: ignore
 
                 # Add row to table
-                table.add_row(backup_name, date_str, time_str, age_str, size_str, description,
-                              label=label)
-            
-            # Set focus to first backup if available
-            if len(backups) > 0:
-                # Use call_after_refresh to ensure the table is fully rendered
-                self.call_after_refresh(self._set_backup_focus)
-        
-        except Exception as e:
-            self.notify(f"Failed to refresh backup list: {e}", severity="error")
+                table.add_row(*cells, key=path, label=label)
+        self._backup_rows = dict(rows)
+
+        # Set focus to first backup if available
+        if rows:
+            # Use call_after_refresh to ensure the table is fully rendered
+            self.call_after_refresh(self._set_backup_focus)
+
+    def _clear_backup_table(self):
+        """Empty the backup table (no game selected)."""
+        self.query_one("#backup_table", DataTable).clear()
+        self._backup_rows = {}
+    
+    def _collect_backup_info(self, backups: List[str]) -> List[Optional[tuple]]:
+        """Read (size_str, description) for each backup on the app's I/O pool so slow
+        drives are stat'ed in parallel; None marks a backup whose info couldn't be read."""
+        def info_or_none(backup_path):
+            try:
+                return self._cached_backup_info(backup_path)
+            except Exception:
+                return None
+        return list(self._io_pool.map(info_or_none, backups))
+    
+    def _cached_backup_info(self, backup_path: str) -> tuple:
+        """Return (formatted size, description) for a backup, reusing the last read while
+        its mtime is unchanged."""
+        mtime = os.stat(backup_path).st_mtime_ns
+        cached = self._backup_info_cache.get(backup_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        size, description = read_backup_info(backup_path)
+        info = (format_file_size(size), description)
+        self._backup_info_cache[backup_path] = (mtime, info)
+        return info
+    
+    def _selected_backup_path(self) -> str:
+        """Return the backup path (row key) of the highlighted backup row."""
+        table = self.query_one("#backup_table", DataTable)
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return row_key.value
     
     def _set_backup_focus(self):
         """Set focus to the first backup in the table."""
@@ -672,14 +861,14 @@ class BackupManagerApp(App):
             self.notify("No game selected", severity="error")
             return
         
-        # Get selected backup name
-        row_key = table.get_row_at(table.cursor_row)
-        backup_name = row_key[1]  # Backup name is now in column 1 (second column)
+        # Rows are keyed by backup path, so the choice survives list refreshes
+        backup_path = self._selected_backup_path()
+        backup_name = os.path.basename(backup_path)
         
         # Show confirmation dialog
         def handle_restore_confirmation(confirmed: bool | None):
             if confirmed:
-                self.perform_restore(backup_name, table.cursor_row)
+                self.perform_restore(backup_path)
         
         self.push_screen(
             ConfirmDialog(
@@ -691,17 +880,14 @@ class BackupManagerApp(App):
             handle_restore_confirmation
         )
     
-    def perform_restore(self, backup_name: str, cursor_row: int):
+    def perform_restore(self, backup_path: str):
         """Perform the actual restore operation."""
         
         def restore_worker():
             try:
                 if not self.manager:
                     return
-                backups = self.manager._get_backup_list()
-                backup_index = cursor_row + 1  # Convert to 1-based index
-                
-                success = self.manager.restore_backup(backup_index, skip_confirmation=True)
+                success = self.manager.restore_backup(backup_path, skip_confirmation=True)
                 self.call_from_thread(self.on_restore_complete, success)
             except Exception as e:
                 self.call_from_thread(self.on_restore_error, str(e))
@@ -733,14 +919,13 @@ class BackupManagerApp(App):
             self.notify("No game selected", severity="error")
             return
         
-        # Get selected backup name
-        row_key = table.get_row_at(table.cursor_row)
-        backup_name = row_key[1]  # Backup name is now in column 1 (second column)
+        backup_path = self._selected_backup_path()
+        backup_name = os.path.basename(backup_path)
         
         # Show confirmation dialog
         def handle_delete_confirmation(confirmed: bool | None):
             if confirmed:
-                self.perform_delete(backup_name, table.cursor_row)
+                self.perform_delete(backup_path)
         
         self.push_screen(
             ConfirmDialog(
@@ -752,15 +937,14 @@ class BackupManagerApp(App):
             handle_delete_confirmation
         )
     
-    def perform_delete(self, backup_name: str, cursor_row: int):
+    def perform_delete(self, backup_path: str):
         """Perform the actual delete operation."""
         if not self.manager:
             self.notify("No backup manager available", severity="error")
             return
             
         try:
-            backup_index = cursor_row + 1  # Convert to 1-based index
-            success = self.manager.delete_backup(backup_index, skip_confirmation=True)
+            success = self.manager.delete_backup(backup_path, skip_confirmation=True)
             
             if success:
                 self.notify("Backup deleted successfully!", severity="information")
@@ -823,17 +1007,21 @@ class BackupManagerApp(App):
     def update_games_table(self):
         """Update the games configuration table."""
         table = self.query_one("#games_table", DataTable)
-        table.clear()
-        
         games = self.config.get("games", {})
         
-        for game_id, game_info in games.items():
-            name = game_info.get("name", "")
-            save_path = game_info.get("save_path", "")
-            backup_path = game_info.get("backup_path", "Default")
-            description = game_info.get("description", "")
-            
-            table.add_row(game_id, name, save_path, backup_path, description)
+        with self.batch_update():
+            table.clear()
+            for game_id, game_info in games.items():
+                table.add_row(*self._games_row(game_id, game_info), key=game_id)
+
+    @staticmethod
+    def _games_row(game_id: str, game_info: Dict[str, Any]) -> tuple:
+        """Cell values for one row of the games table."""
+        name = game_info.get("name", "")
+        save_path = game_info.get("save_path", "")
+        backup_path = game_info.get("backup_path", "Default")
+        description = game_info.get("description", "")
+        return game_id, name, save_path, backup_path, description
     
     @on(Button.Pressed, "#add_game")
     def on_add_game(self):
@@ -850,10 +1038,10 @@ class BackupManagerApp(App):
                     self.config["games"] = {}
                 
                 self.config["games"][game_id] = game_info
-                save_games_config(self.config_path, self.config)
+                self._mark_config_dirty()
                 
                 self.notify(f"Game '{game_info['name']}' added successfully!", severity="information")
-                self.update_games_table()
+                self.query_one("#games_table", DataTable).add_row(*self._games_row(game_id, game_info), key=game_id)
                 self.update_game_list()
         
         self.push_screen(
@@ -890,10 +1078,16 @@ class BackupManagerApp(App):
                 else:
                     self.config["games"][game_id] = new_game_info
                 
-                save_games_config(self.config_path, self.config)
+                self._mark_config_dirty()
                 
                 self.notify(f"Game '{new_game_info['name']}' updated successfully!", severity="information")
-                self.update_games_table()
+                # Only this row changed; a renamed game moves to the end, like its config entry
+                if new_game_id != game_id:
+                    table.remove_row(game_id)
+                    table.add_row(*self._games_row(new_game_id, new_game_info), key=new_game_id)
+                else:
+                    for column_key, value in zip(self._games_columns, self._games_row(game_id, new_game_info)):
+                        table.update_cell(game_id, column_key, value)
                 self.update_game_list()
         
         self.push_screen(
@@ -904,6 +1098,16 @@ class BackupManagerApp(App):
     @on(Button.Pressed, "#remove_game")
     def on_remove_game(self):
         """Remove the selected game configuration."""
+        self.remove_selected_game(confirm=True)
+
+    def action_remove_game_now(self):
+        """Remove the selected game without asking (Shift+Delete on the games table)."""
+        table = self.query_one("#games_table", DataTable)
+        if self.focused is table:
+            self.remove_selected_game(confirm=False)
+
+    def remove_selected_game(self, confirm: bool = True):
+        """Remove the game under the games table cursor, optionally asking first."""
         table = self.query_one("#games_table", DataTable)
         
         if table.cursor_row is None or table.cursor_row >= table.row_count:
@@ -920,12 +1124,16 @@ class BackupManagerApp(App):
         def handle_remove_confirmation(confirmed: bool | None):
             if confirmed:
                 del self.config["games"][game_id]
-                save_games_config(self.config_path, self.config)
+                self._mark_config_dirty()
                 
                 self.notify(f"Game '{game_name}' removed successfully!", severity="information")
-                self.update_games_table()
+                table.remove_row(game_id)
                 self.update_game_list()
         
+        if not confirm:
+            handle_remove_confirmation(True)
+            return
+        
         self.push_screen(
             ConfirmDialog(
                 "Confirm Remove",
@@ -1003,6 +1211,7 @@ class BackupManagerApp(App):
             
             if "settings" not in self.config:
                 self.config["settings"] = {}
+            previous_settings = dict(self.config["settings"])
             
             self.config["settings"]["default_max_backups"] = max_backups
             self.config["settings"]["default_backup_path"] = backup_path
@@ -1017,10 +1226,15 @@ class BackupManagerApp(App):
             self.config["settings"]["auto_refresh_enabled"] = auto_refresh_enabled
             self.config["settings"]["auto_refresh_interval"] = auto_refresh_interval
             
-            save_games_config(self.config_path, self.config)
+            self._mark_config_dirty()
             
             self.notify("Settings saved successfully!", severity="information")
+            if self.config["settings"] == previous_settings:
+                # Nothing changed: keep the cached managers and the auto-refresh countdown
+                return
             
+            # Cached managers for other games were built with the old settings
+            self._managers.clear()
             # Reinitialize backup manager if needed
             if self.manager:
                 self.manager.max_backups = max_backups
@@ -1103,20 +1317,40 @@ class BackupManagerApp(App):
             while True:
                 # Wait for the configured interval (in seconds)
                 await asyncio.sleep(max(1, int(minutes)) * 60)
-                # Call refresh on the main thread/context
+                # This task runs on the app's event loop, so refresh directly.
+                # Nobody is looking at the list on the config tab or with the
+                # terminal unfocused; refresh once it is shown again instead.
+                if not self._backup_list_visible():
+                    self._refresh_skipped = True
+                    continue
                 try:
-                    # Use call_from_thread to safely update UI if running in different thread
-                    self.call_from_thread(self.refresh_backup_list)
+                    self.refresh_backup_list()
                 except Exception:
-                    # Fallback to direct call
-                    try:
-                        self.refresh_backup_list()
-                    except Exception:
-                        pass
+                    pass
         except asyncio.CancelledError:
             # Task was cancelled; just exit
             return
     
+    def _backup_list_visible(self) -> bool:
+        """True if the backup tab is active and the terminal has focus."""
+        tabs = self.query_one("#tabs", TabbedContent)
+        return self.app_focus and tabs.active == "backup_tab"
+
+    def _refresh_if_skipped(self):
+        """Catch up on an auto-refresh that was skipped while the list was hidden."""
+        if self._refresh_skipped and self._backup_list_visible():
+            self._refresh_skipped = False
+            self.refresh_backup_list()
+
+    @on(TabbedContent.TabActivated, pane="#backup_tab")
+    def on_backup_tab_activated(self):
+        """Refresh on returning to the backup tab if a tick was skipped."""
+        self._refresh_if_skipped()
+
+    def on_app_focus(self, event: events.AppFocus):
+        """Refresh on regaining terminal focus if a tick was skipped."""
+        self._refresh_if_skipped()
+    
     def action_create_backup(self):
         """Create backup via keyboard shortcut."""
         self.on_create_backup()
@@ -1134,6 +1368,8 @@ def main():
     """Run the Textual backup manager application."""
     app = BackupManagerApp()
     app.run()
+    if app.config_save_error is not None:
+        print_error(f"Failed to save configuration: {app.config_save_error}")
 
 
 if __name__ == "__main__":
@@ -123,3 +123,30 @@ def fake_walk_builder(fake_file_tree_factory):
         return fake_file_tree_factory(str(root), nested)
 
     return builder
+
+
+@pytest.fixture
+def fake_scan_tree_builder():
+    """Return a builder that accepts a Path and nested dict and returns a `backup._scan_tree` replacement.
+
+    Usage in tests:
+        monkeypatch.setattr(backup, "_scan_tree", fake_scan_tree_builder(Path(root), nested_dict))
+    """
+
+    def builder(root: Path, nested: dict):
+        def walk(subtree: dict, rel_root: str):
+            for name, val in subtree.items():
+                rel = os.path.join(rel_root, name) if rel_root else name
+                if isinstance(val, dict):
+                    yield rel, True
+                    yield from walk(val, rel)
+                else:
+                    yield rel, False
+
+        def fake_scan_tree(src, ignore=None):
+            if Path(src) == Path(root):
+                yield from walk(nested, "")
+
+        return fake_scan_tree
+
+    return builder
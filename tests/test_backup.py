@@ -110,19 +110,18 @@ def test_interrupted_backup_leaves_no_partial_and_metadata_on_success(tmp_path,
 
     manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=5)
 
-    # Monkeypatch shutil.copy2 to raise after a few copies to simulate interruption
-    import shutil as _shutil
-    original_copy2 = _shutil.copy2
+    # Monkeypatch the per-file copy to raise after a few copies to simulate interruption
+    original_copy = backup._fast_copyfile
     counter = {"count": 0}
 
-    def failing_copy2(src, dst, follow_symlinks=True):
+    def failing_copy(src, dst):
         counter["count"] += 1
         # allow first two files then fail to simulate crash
         if counter["count"] == 3:
             raise RuntimeError("simulated interruption")
-        return original_copy2(src, dst, follow_symlinks=follow_symlinks)
+        return original_copy(src, dst)
 
-    monkeypatch.setattr("shutil.copy2", failing_copy2)
+    monkeypatch.setattr(backup, "_fast_copyfile", failing_copy)
 
     # Attempt backup; should handle exception and return None (failure)
     res = manager.create_backup("interrupted")
@@ -132,8 +131,8 @@ def test_interrupted_backup_leaves_no_partial_and_metadata_on_success(tmp_path,
     visible_backups = [p for p in backup_dir.iterdir() if p.is_dir() and not p.name.startswith('.')]
     assert len(visible_backups) == 0
 
-    # Now restore copy2 and perform a successful backup to verify metadata is written
-    monkeypatch.setattr("shutil.copy2", original_copy2)
+    # Now restore the copy and perform a successful backup to verify metadata is written
+    monkeypatch.setattr(backup, "_fast_copyfile", original_copy)
     success = manager.create_backup("final")
     assert success is not None
 
@@ -223,3 +222,450 @@ def test_move_failure_cleanup_on_exception(tmp_path, monkeypatch):
     # Ensure no leftover temp dirs (those start with .backup_)
     tmp_dirs = [p for p in backup_dir.iterdir() if p.is_dir() and p.name.startswith('.backup_')]
     assert len(tmp_dirs) == 0
+
+
+def test_create_backup_copies_nested_tree_and_skips_ignored(tmp_path):
+    save_dir = tmp_path / "nested_saves"
+    (save_dir / "slot1" / "deep").mkdir(parents=True)
+    (save_dir / "root.sav").write_text("root")
+    (save_dir / "slot1" / "player.sav").write_text("player")
+    (save_dir / "slot1" / "deep" / "world.sav").write_text("world")
+    (save_dir / "scratch.tmp").write_text("ignored")
+    (save_dir / "__pycache__").mkdir()
+    (save_dir / "__pycache__" / "mod.pyc").write_text("ignored")
+
+    backup_dir = tmp_path / "backups"
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=3)
+    result = manager.create_backup()
+    assert result is not None
+
+    assert (result / "root.sav").read_text() == "root"
+    assert (result / "slot1" / "player.sav").read_text() == "player"
+    assert (result / "slot1" / "deep" / "world.sav").read_text() == "world"
+    assert not (result / "scratch.tmp").exists()
+    assert not (result / "__pycache__").exists()
+
+
+def test_create_backup_follows_symlinked_subdirectory(tmp_path):
+    # A linked slot/cloud folder is backed up by content, as shutil.copytree did
+    cloud = tmp_path / "cloud"
+    cloud.mkdir()
+    (cloud / "a.sav").write_text("cloud")
+    (cloud / "loop").symlink_to(cloud, target_is_directory=True)
+    save_dir = tmp_path / "saves"
+    save_dir.mkdir()
+    (save_dir / "cloudslot").symlink_to(cloud, target_is_directory=True)
+
+    manager = backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=3)
+    result = manager.create_backup()
+    assert result is not None
+
+    assert (result / "cloudslot" / "a.sav").read_text() == "cloud"
+    assert not (result / "cloudslot").is_symlink()
+    # The link back to its own parent is not followed forever
+    assert not (result / "cloudslot" / "loop").exists()
+
+
+def test_create_backup_fails_on_unreadable_subdirectory(tmp_path, monkeypatch):
+    save_dir = tmp_path / "saves"
+    (save_dir / "locked").mkdir(parents=True)
+    (save_dir / "a.sav").write_text("a")
+    manager = backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=3)
+
+    real_scandir = os.scandir
+    def scandir(path):
+        if os.fspath(path) == str(save_dir / "locked"):
+            raise PermissionError(13, "Permission denied", os.fspath(path))
+        return real_scandir(path)
+    monkeypatch.setattr(backup.os, "scandir", scandir)
+
+    assert manager.create_backup() is None
+    assert manager._get_backup_list() == []
+
+
+def test_restore_backup_keeps_backups_folder_inside_save_dir(tmp_path):
+    # Default layout: backups live inside the save directory
+    save_dir = tmp_path / "save_dir"
+    save_dir.mkdir()
+    (save_dir / "a.txt").write_text("old")
+    (save_dir / "stale.txt").write_text("stale")
+
+    manager = backup.SaveBackupManager(save_dir, None, max_backups=5)
+    bpath = save_dir / "backups" / "backup_20250101_000000"
+    bpath.mkdir()
+    (bpath / "a.txt").write_text("new")
+    (bpath / ".backup_description").write_text("desc", encoding='utf-8')
+
+    ok = manager.restore_backup(backup_choice=1, skip_confirmation=True)
+    assert ok is True
+
+    assert (save_dir / "a.txt").read_text() == "new"
+    assert not (save_dir / "stale.txt").exists()
+    assert not (save_dir / ".backup_description").exists()
+    # The backup itself must survive the swap
+    assert (bpath / "a.txt").read_text() == "new"
+    assert manager._get_backup_list() == [str(bpath)]
+
+
+def _dead_pid():
+    import subprocess
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_interrupted_restore_swap_puts_original_saves_back(tmp_path):
+    # Simulate a crash between the two renames: save dir moved aside, staging not yet moved in
+    save_dir = tmp_path / "save_dir"
+    stem = f".save_dir.restore_20250101_000000_{_dead_pid()}.x1"
+    staging = tmp_path / stem
+    old_dir = tmp_path / (stem + ".old")
+    (old_dir / "backups" / "backup_20250101_000000").mkdir(parents=True)
+    (old_dir / "a.txt").write_text("original")
+    staging.mkdir()
+    (staging / "a.txt").write_text("restored")
+
+    manager = backup.SaveBackupManager(save_dir, None, max_backups=5)
+
+    assert (save_dir / "a.txt").read_text() == "original"
+    assert manager._get_backup_list() == [str(save_dir / "backups" / "backup_20250101_000000")]
+    assert not old_dir.exists() and not staging.exists()
+
+
+def test_restore_leftovers_of_running_restore_are_kept(tmp_path):
+    save_dir = tmp_path / "save_dir"
+    save_dir.mkdir()
+    live = tmp_path / f".save_dir.restore_20250101_000000_{os.getpid()}.x1"
+    dead = tmp_path / f".save_dir.restore_20250101_000000_{_dead_pid()}.x2.old"
+    live.mkdir()
+    dead.mkdir()
+
+    backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=5)
+
+    assert live.exists()
+    assert not dead.exists()
+
+
+def test_restore_with_working_directory_in_save_dir(tmp_path, monkeypatch):
+    # No game selected: the save dir is the current directory, backups go to ./backups
+    save_dir = tmp_path / "save_dir"
+    save_dir.mkdir()
+    (save_dir / "a.txt").write_text("old")
+    monkeypatch.chdir(save_dir)
+
+    manager = backup.SaveBackupManager(None, "./backups", max_backups=5)
+    assert manager.create_backup() is not None
+    (save_dir / "a.txt").write_text("changed")
+
+    assert manager.restore_backup(backup_choice=1, skip_confirmation=True) is True
+    assert os.getcwd() == str(save_dir)
+    assert (save_dir / "a.txt").read_text() == "old"
+    assert len(manager._get_backup_list()) == 1
+
+
+def test_in_place_restore_keeps_app_files_in_script_folder(tmp_path, monkeypatch):
+    # Run from the script's folder with no game selected: the save dir holds the app itself
+    save_dir = tmp_path / "app"
+    save_dir.mkdir()
+    (save_dir / "backup.py").write_text("script")
+    (save_dir / "a.txt").write_text("old")
+    monkeypatch.setattr(backup, "__file__", str(save_dir / "backup.py"))
+    monkeypatch.chdir(save_dir)
+
+    manager = backup.SaveBackupManager(None, "./backups", max_backups=5)
+    backup_path = manager.create_backup()
+    assert backup_path is not None
+    (save_dir / "a.txt").write_text("changed")
+    (save_dir / "games_config.json").write_text("{}")
+    (save_dir / "backup_gui.py").write_text("gui")
+
+    assert manager._restore_by_swap(backup_path) is False
+    assert manager._restore_in_place(backup_path) is True
+    assert (save_dir / "a.txt").read_text() == "old"
+    assert (save_dir / "games_config.json").read_text() == "{}"
+    assert (save_dir / "backup_gui.py").read_text() == "gui"
+    assert (save_dir / "backup.py").exists()
+
+
+def test_compressed_backup_round_trip(tmp_path):
+    save_dir = tmp_path / "saves_zip"
+    (save_dir / "slot").mkdir(parents=True)
+    (save_dir / "a.txt").write_text("alpha")
+    (save_dir / "slot" / "b.txt").write_text("beta")
+
+    backup_dir = tmp_path / "backups"
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=3, compress=True)
+    result = manager.create_backup("zipped")
+    assert result is not None
+    assert result.name.endswith(".zip") and result.is_file()
+    assert backup.read_backup_description(result) == "zipped"
+    assert manager._get_backup_list() == [str(result)]
+
+    # Change the saves, then restore from the archive
+    (save_dir / "a.txt").write_text("changed")
+    (save_dir / "extra.txt").write_text("extra")
+    assert manager.restore_backup(backup_choice=1, skip_confirmation=True) is True
+    assert (save_dir / "a.txt").read_text() == "alpha"
+    assert (save_dir / "slot" / "b.txt").read_text() == "beta"
+    assert not (save_dir / "extra.txt").exists()
+    assert not (save_dir / ".backup_description").exists()
+
+    assert manager.delete_backup(backup_choice=1, skip_confirmation=True) is True
+    assert not result.exists()
+
+
+def test_dedupe_backup_hardlinks_unchanged_files(tmp_path):
+    save_dir = tmp_path / "saves_dedupe"
+    save_dir.mkdir()
+    (save_dir / "same.txt").write_text("same")
+    (save_dir / "edit.txt").write_text("v1")
+
+    backup_dir = tmp_path / "backups"
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=3, dedupe=True)
+    first = manager.create_backup()
+    assert first is not None
+    assert (first / ".backup_manifest.json").exists()
+
+    (save_dir / "edit.txt").write_text("version two")
+    second = tmp_path / "second"
+    second.mkdir()
+    copied = manager._parallel_copytree(save_dir, second, link_dest=manager._latest_manifest())
+    assert copied == 2
+    assert (second / "same.txt").stat().st_ino == (first / "same.txt").stat().st_ino
+    assert (second / "edit.txt").stat().st_ino != (first / "edit.txt").stat().st_ino
+    assert (second / "edit.txt").read_text() == "version two"
+
+    # Restoring must not leak bookkeeping files into the save dir
+    assert manager.restore_backup(backup_choice=1, skip_confirmation=True) is True
+    assert not (save_dir / ".backup_manifest.json").exists()
+    assert not (save_dir / ".backup_meta.json").exists()
+
+
+def test_save_unchanged_compares_against_latest_manifest(tmp_path):
+    save_dir = tmp_path / "saves_unchanged"
+    (save_dir / "sub").mkdir(parents=True)
+    (save_dir / "a.sav").write_text("one")
+    (save_dir / "sub" / "b.sav").write_text("two")
+
+    manager = backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=3)
+    assert manager.save_unchanged() is False  # nothing to compare against yet
+
+    assert manager.create_backup() is not None
+    assert manager.save_unchanged() is True
+
+    (save_dir / "sub" / "b.sav").write_text("changed")
+    assert manager.save_unchanged() is False
+
+    assert manager.create_backup() is not None
+    assert manager.save_unchanged() is True
+    (save_dir / "c.sav").write_text("new file")
+    assert manager.save_unchanged() is False
+
+
+def test_parallel_rmtree_removes_large_tree(tmp_path):
+    save_dir = tmp_path / "saves_rm"
+    save_dir.mkdir()
+    manager = backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=3)
+
+    tree = tmp_path / "big"
+    for d in range(4):
+        sub = tree / f"d{d}" / "nested"
+        sub.mkdir(parents=True)
+        for f in range(30):
+            (sub / f"f{f}.sav").write_text("x")
+    (tree / "d0" / "nested" / "f0.sav").chmod(0o444)
+
+    manager._parallel_rmtree(tree)
+    assert not tree.exists()
+
+
+def test_parallel_rmtree_many_never_walks_through_links(tmp_path):
+    save_dir = tmp_path / "saves_rm"
+    save_dir.mkdir()
+    manager = backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=3)
+
+    outside = tmp_path / "cloud"
+    outside.mkdir()
+    for f in range(100):
+        (outside / f"f{f}.sav").write_text("x")
+    linked_root = tmp_path / "linked_root"
+    linked_root.symlink_to(outside, target_is_directory=True)
+
+    errors = manager._parallel_rmtree_many([str(linked_root)])
+    assert str(linked_root) in errors
+    assert len(list(outside.iterdir())) == 100
+
+
+def test_read_backup_info_uses_metadata_and_falls_back(tmp_path):
+    save_dir = tmp_path / "saves_info"
+    save_dir.mkdir()
+    (save_dir / "slot.sav").write_text("data")
+    manager = backup.SaveBackupManager(save_dir, tmp_path / "backups", max_backups=3)
+    result = manager.create_backup("boss fight")
+    assert result is not None
+
+    meta = json.loads((result / ".backup_meta.json").read_text())
+    assert meta["files"] == 1 and meta["size_bytes"] == 4
+    assert backup.read_backup_info(result) == (4, "boss fight")
+
+    # Legacy backup without metadata is measured directly
+    legacy = tmp_path / "backups" / "backup_20200101_000000"
+    legacy.mkdir()
+    (legacy / "slot.sav").write_text("12345")
+    (legacy / ".backup_description").write_text("old")
+    assert backup.read_backup_info(legacy) == (8, "old")
+
+
+def test_save_games_config_replaces_file_atomically(tmp_path):
+    config_path = tmp_path / "games_config.json"
+    config_path.write_text("{}")
+    config = {"games": {"g": {"name": "Game", "save_path": "C:\\saves"}}, "settings": {}}
+
+    backup.save_games_config(config_path, config)
+    assert json.loads(config_path.read_text(encoding="utf-8")) == config
+    assert not (tmp_path / "games_config.json.tmp").exists()
+
+
+def test_save_games_config_raises_and_keeps_old_file(tmp_path, monkeypatch):
+    config_path = tmp_path / "games_config.json"
+    config_path.write_text("{}")
+
+    def failing_replace(src, dst):
+        raise OSError(errno.EACCES, "denied")
+    monkeypatch.setattr(backup.os, "replace", failing_replace)
+
+    with pytest.raises(OSError):
+        backup.save_games_config(config_path, {"games": {}, "settings": {}})
+    assert config_path.read_text() == "{}"
+    assert not (tmp_path / "games_config.json.tmp").exists()
+
+
+def test_backup_list_cache_sees_external_changes(tmp_path):
+    save_dir = tmp_path / "saves_cache"
+    save_dir.mkdir()
+    (save_dir / "slot.sav").write_text("data")
+    backup_dir = tmp_path / "backups"
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=5)
+    first = manager.create_backup()
+    assert manager._get_backup_list() == [str(first)]
+
+    # A backup made by another process (e.g. the CLI while the TUI is open)
+    external = backup_dir / "backup_20990101_000000"
+    external.mkdir()
+    os.utime(backup_dir, ns=(0, os.stat(backup_dir).st_mtime_ns + 1))
+    assert manager._get_backup_list() == [str(external), str(first)]
+
+    assert manager.delete_backup(backup_choice=1, skip_confirmation=True) is True
+    assert manager._get_backup_list() == [str(first)]
+
+
+def test_backup_list_cache_ignores_recent_mtime(tmp_path):
+    # On coarse-mtime filesystems a change within the same tick keeps the old mtime
+    save_dir = tmp_path / "saves_cache"
+    save_dir.mkdir()
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=5)
+    first = backup_dir / "backup_20200101_000000"
+    first.mkdir()
+    assert manager._get_backup_list() == [str(first)]
+
+    mtime = os.stat(backup_dir).st_mtime_ns
+    second = backup_dir / "backup_20200102_000000"
+    second.mkdir()
+    os.utime(backup_dir, ns=(mtime, mtime))
+    assert manager._get_backup_list() == [str(second), str(first)]
+
+    # An mtime well in the past is trusted
+    old = mtime - 3600 * 10**9
+    os.utime(backup_dir, ns=(old, old))
+    assert manager._get_backup_list() == [str(second), str(first)]
+    assert manager._backup_scan is not None and manager._backup_scan[0] == old
+
+
+def test_remove_backups_batches_folders_and_archives(tmp_path):
+    save_dir = tmp_path / "saves_batch"
+    save_dir.mkdir()
+    backup_dir = tmp_path / "backups"
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=1)
+
+    paths = []
+    for n in range(3):
+        folder = backup_dir / f"backup_2020010{n + 1}_000000"
+        (folder / "slot").mkdir(parents=True)
+        for f in range(30):
+            (folder / "slot" / f"{f}.sav").write_text("x")
+        paths.append(str(folder))
+    archive = backup_dir / "backup_20200105_000000.zip"
+    archive.write_bytes(b"")
+    paths.append(str(archive))
+
+    results = manager._remove_backups(paths)
+    assert list(results) == paths
+    assert all(error is None for error in results.values())
+    assert manager._get_backup_list() == []
+
+
+def test_fast_copyfile_preserves_data_and_mtime(tmp_path):
+    for name, size in (("small.ini", 100), ("large.bin", backup._SMALL_FILE_SIZE * 3 + 7)):
+        src = tmp_path / name
+        src.write_bytes(os.urandom(size))
+        os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_123_456_789))
+        dst = tmp_path / f"copy_{name}"
+        backup._fast_copyfile(str(src), str(dst))
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_restore_in_place_replaces_contents(tmp_path):
+    save_dir = tmp_path / "saves_inplace"
+    (save_dir / "slot1").mkdir(parents=True)
+    (save_dir / "slot1" / "a.sav").write_text("old")
+    (save_dir / "loose.txt").write_text("old")
+    manager = backup.SaveBackupManager(save_dir, save_dir / "backups", max_backups=3)
+
+    snapshot = tmp_path / "backup_20200101_000000"
+    (snapshot / "slot2").mkdir(parents=True)
+    (snapshot / "slot2" / "b.sav").write_text("new")
+
+    assert manager._restore_in_place(snapshot) is True
+    assert sorted(p.name for p in save_dir.iterdir()) == ["backups", "slot2"]
+    assert (save_dir / "slot2" / "b.sav").read_text() == "new"
+
+
+def test_restore_in_place_removes_linked_folder_without_emptying_it(tmp_path):
+    cloud = tmp_path / "cloud"
+    cloud.mkdir()
+    (cloud / "c.sav").write_text("keep")
+    save_dir = tmp_path / "saves_inplace"
+    save_dir.mkdir()
+    (save_dir / "cloudslot").symlink_to(cloud, target_is_directory=True)
+    manager = backup.SaveBackupManager(save_dir, save_dir / "backups", max_backups=3)
+
+    snapshot = tmp_path / "backup_20200101_000000"
+    snapshot.mkdir()
+    (snapshot / "a.sav").write_text("new")
+
+    assert manager._restore_in_place(snapshot) is True
+    assert sorted(p.name for p in save_dir.iterdir()) == ["a.sav", "backups"]
+    assert (cloud / "c.sav").read_text() == "keep"
+
+
+def test_restore_and_delete_accept_backup_path(tmp_path):
+    save_dir = tmp_path / "saves_bypath"
+    save_dir.mkdir()
+    (save_dir / "a.sav").write_text("old")
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+    for name, content in (("backup_20200101_000000", "first"), ("backup_20200102_000000", "second")):
+        (backup_dir / name).mkdir()
+        (backup_dir / name / "a.sav").write_text(content)
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=5)
+
+    older = str(backup_dir / "backup_20200101_000000")
+    assert manager.restore_backup(older, skip_confirmation=True) is True
+    assert (save_dir / "a.sav").read_text() == "first"
+
+    assert manager.delete_backup(str(tmp_path / "not_a_backup"), skip_confirmation=True) is False
+    assert manager.delete_backup(older, skip_confirmation=True) is True
+    assert manager._get_backup_list() == [str(backup_dir / "backup_20200102_000000")]
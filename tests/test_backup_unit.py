@@ -1,3 +1,4 @@
+import datetime
 import json
 from pathlib import Path
 
@@ -15,24 +16,24 @@ def fake_mkdtemp(prefix: str | None = None, dir: str | None = None) -> str:
     return str(base_dir / (prefix_str + "TMP"))
 
 
-def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture, fake_walk_builder):
+def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture, fake_scan_tree_builder):
     # Fully isolated test: no filesystem operations should run
     # Prevent actual directory creation during manager init
     monkeypatch.setattr(backup.Path, "mkdir", fake_mkdir_func)
     manager = backup.SaveBackupManager("/fake/save_dir", "/fake/backups", max_backups=2)
 
-    # Fake os.walk to report two files in save_dir and in backup destination
+    # Fake the save-dir scan to report two files
     nested = {"a.txt": None, "b.txt": None}
-    monkeypatch.setattr(backup.os, "walk", fake_walk_builder(Path("/fake/save_dir"), nested))
+    monkeypatch.setattr(backup, "_scan_tree", fake_scan_tree_builder(Path("/fake/save_dir"), nested))
 
     # Fake mkdtemp to return a temp path string inside the fake backup dir
     monkeypatch.setattr(tempfile, "mkdtemp", fake_mkdtemp_func)
 
-    # Fake copytree to do nothing
-    def fake_copytree(src, dst, **kwargs):
-        return dst
+    # Fake the parallel copy to do nothing
+    def fake_parallel_copytree(self, src, dst, **kwargs):
+        return 2
 
-    monkeypatch.setattr(backup.shutil, "copytree", fake_copytree)
+    monkeypatch.setattr(backup.SaveBackupManager, "_parallel_copytree", fake_parallel_copytree)
 
     # Fake os.replace to simulate atomic rename success
     def fake_replace(a, b):
@@ -59,16 +60,16 @@ def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkd
     assert meta.get("move_method") == "atomic"
 
 
-def test_create_backup_isolated_exdev_and_move_called(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture, fake_walk_builder):
+def test_create_backup_isolated_exdev_and_move_called(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture, fake_scan_tree_builder):
     # Isolated test for EXDEV fallback that ensures shutil.move is called
     # Prevent actual directory creation during manager init
     monkeypatch.setattr(backup.Path, "mkdir", fake_mkdir_func)
     manager = backup.SaveBackupManager("/fake/save_dir", "/fake/backups", max_backups=2)
 
     nested = {"a.txt": None}
-    monkeypatch.setattr(backup.os, "walk", fake_walk_builder(Path("/fake/save_dir"), nested))
+    monkeypatch.setattr(backup, "_scan_tree", fake_scan_tree_builder(Path("/fake/save_dir"), nested))
     monkeypatch.setattr(tempfile, "mkdtemp", fake_mkdtemp_func)
-    monkeypatch.setattr(backup.shutil, "copytree", lambda src, dst, **kwargs: dst)
+    monkeypatch.setattr(backup.SaveBackupManager, "_parallel_copytree", lambda self, src, dst, **kwargs: 1)
 
     # Make os.replace raise EXDEV
     def fake_replace(a, b):
@@ -99,3 +100,59 @@ def test_create_backup_isolated_exdev_and_move_called(monkeypatch, fake_mkdtemp_
     assert meta_key in writes
     meta = json.loads(writes[meta_key])
     assert meta.get("move_method") == "copied"
+
+
+def test_parse_backup_timestamp():
+    expected = datetime.datetime(2024, 3, 5, 7, 8, 9)
+    assert backup.parse_backup_timestamp("backup_20240305_070809") == expected
+    assert backup.parse_backup_timestamp("backup_20240305_070809.zip") == expected
+    assert backup.parse_backup_timestamp("backup_20241305_070809") is None
+    assert backup.parse_backup_timestamp("backup_manual") is None
+
+
+def test_format_age():
+    assert backup.format_age(datetime.timedelta(seconds=30)) == "Just now"
+    assert backup.format_age(datetime.timedelta(minutes=5, seconds=10)) == "5 minutes ago"
+    assert backup.format_age(datetime.timedelta(hours=2, minutes=59)) == "2 hours ago"
+    assert backup.format_age(datetime.timedelta(days=3, hours=4)) == "3 days ago"
+    assert backup.format_age(datetime.timedelta(seconds=30), short=True) == "0m ago"
+    assert backup.format_age(datetime.timedelta(days=1), short=True) == "1d ago"
+
+
+def test_config_signature_ignores_key_order():
+    a = {"games": {"g": {"name": "G"}}, "settings": {"x": 1, "y": 2}}
+    b = {"settings": {"y": 2, "x": 1}, "games": {"g": {"name": "G"}}}
+    assert backup.config_signature(a) == backup.config_signature(b)
+    b["settings"]["x"] = 3
+    assert backup.config_signature(a) != backup.config_signature(b)
+
+
+def test_is_valid_game_id():
+    assert backup.is_valid_game_id("grim_dawn")
+    assert backup.is_valid_game_id("game-2.v1")
+    for bad in ("", "grim dawn", "a\tb", "a/b", "a\\b", "c:d", "what?", 'q"t', "a|b"):
+        assert not backup.is_valid_game_id(bad), bad
+
+
+def test_background_output_holds_other_threads_output():
+    import io
+    import threading
+
+    stream = io.StringIO()
+    out = backup._BackgroundOutput(stream, threading.current_thread())
+
+    def worker():
+        out.write("\rCopying: |###| 50.0%")
+        out.write("\x1b[93m⚠ Skipped locked file\x1b[0m\n")
+        out.write("ℹ Backup created\n")
+
+    out.hold()
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    out.write("menu\n")
+    out.release()
+
+    assert stream.getvalue() == "menu\n"
+    assert out.take_problems() == ["⚠ Skipped locked file"]
+    assert out.take_problems() == []